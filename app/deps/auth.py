@@ -1,9 +1,15 @@
+from os import getenv
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.security import SECRET_KEY, ALGORITHM
+from app.utils.token_cache import TokenCache
+
+# Verified payloads, so each token's signature is checked once, not per request
+token_cache = TokenCache(int(getenv("JWT_CACHE_SIZE", 10000)))
 
 faculty_oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/auth/faculty/login",
@@ -19,13 +25,18 @@ admin_oauth2_scheme = OAuth2PasswordBearer(
 )   
 
 def _decode_token(token: str):
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token"
         )
+    token_cache.put(token, payload)
+    return payload
 
 
 def get_current_faculty(token: str = Depends(faculty_oauth2_scheme)):
@@ -35,6 +46,30 @@ def get_current_faculty(token: str = Depends(faculty_oauth2_scheme)):
     return payload["uid"]  # ✅ returns faculty_id directly
 
 
+def _require_designation(designation: str, detail: str):
+    """
+    Build a dependency that admits only faculty whose token carries the given
+    `designation` claim (issued by faculty_login), without touching the DB.
+    """
+    def dependency(token: str = Depends(faculty_oauth2_scheme)):
+        payload = _decode_token(token)
+        if payload.get("role") != "FACULTY":
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid faculty token")
+        if payload.get("designation") != designation:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+        return payload["uid"]
+    return dependency
+
+
+require_counsellor = _require_designation("Counsellor", "Access denied: not a counsellor")
+require_academic_head = _require_designation("Academic Head", "Access denied: not an Academic Head")
+
+
+def get_faculty_department(token: str = Depends(faculty_oauth2_scheme)) -> Optional[str]:
+    """Department claim of a faculty token; None for institution-wide staff."""
+    return _decode_token(token).get("department")
+
+
 def get_current_student(token: str = Depends(student_oauth2_scheme)):
     payload = _decode_token(token)
     if payload.get("role") != "STUDENT":
@@ -0,0 +1,42 @@
+# app/jobs/rebalance_l1.py
+"""
+Recount every counsellor's pending Level-1 queue (repairing any drift in
+counsellor_loads), then move work off away or overloaded counsellors onto
+the least-loaded colleagues in the same department.
+
+Usage: python -m app.jobs.rebalance_l1 [--department DEPT] [--recount-only]
+"""
+
+import argparse
+import logging
+
+from app.database import SessionLocal
+from app.repositories import counsellor_loads
+from app.services.l1_routing import rebalance
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recount and rebalance Level-1 queues")
+    parser.add_argument("--department")
+    parser.add_argument("--recount-only", action="store_true")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        stats = {"recount": counsellor_loads.recount(db)}
+        if not args.recount_only:
+            stats["rebalance"] = rebalance(db, args.department)
+    finally:
+        db.close()
+    logger.info("Level-1 rebalance: %s", stats)
+    return stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    main()
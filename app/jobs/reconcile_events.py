@@ -0,0 +1,32 @@
+# app/jobs/reconcile_events.py
+"""
+Recompute remaining seats and OPEN/FILLED status for every event from the
+L2-approved applications, fixing any drift.
+
+Usage: python -m app.jobs.reconcile_events
+"""
+
+import logging
+
+from app.database import SessionLocal
+from app.services.events import reconcile_events
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    db = SessionLocal()
+    try:
+        stats = reconcile_events(db)
+    finally:
+        db.close()
+    logger.info("Event reconciliation: %s", stats)
+    return stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    main()
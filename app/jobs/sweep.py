@@ -0,0 +1,33 @@
+# app/jobs/sweep.py
+"""
+One sweeper pass from the command line (cron), the same work the in-app
+sweeper does every SWEEP_INTERVAL_SECONDS: close past events, expire stale
+applications and purge used / expired OTPs.
+
+Usage: python -m app.jobs.sweep
+"""
+
+import logging
+
+from app.database import SessionLocal
+from app.services.sweeper import sweep
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    db = SessionLocal()
+    try:
+        stats = sweep(db)
+    finally:
+        db.close()
+    logger.info("Sweep: %s", stats)
+    return stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    main()
@@ -2,6 +2,12 @@
 
 from fastapi import FastAPI
 import logging
+from app.database import engine, async_engine
+from app.middleware.query_counter import QueryCounterMiddleware, install_query_counter
+from app.utils.password_pool import password_pool
+from app.services.email_outbox import email_outbox
+from app.services.od_admission import admission
+from app.services.sweeper import SWEEP_ENABLED, sweeper
 from app.routers.student.event_requests import router as student_event_requests_router
 from app.routers.auth import student as auth_student
 from app.routers.auth import faculty as auth_faculty
@@ -11,9 +17,19 @@ from app.routers.student import od_applications as student_od
 from app.routers.faculty.od_counsellor import router as counsellor_router
 from app.routers.faculty.od_academic_head import router as academic_head_router
 from app.routers.faculty.event_requests import router as faculty_event_requests_router
+from app.routers.admin.metrics import router as admin_metrics_router
+from app.routers.admin.exports import router as admin_exports_router
+from app.routers.admin.analytics import router as admin_analytics_router
+from app.routers.admin.roster import router as admin_roster_router
+from app.routers.admin.provisioning import router as admin_provisioning_router
 
 app = FastAPI()
 
+# Per-request SQL statement counting and query budgets
+install_query_counter(engine)
+install_query_counter(async_engine.sync_engine)
+app.add_middleware(QueryCounterMiddleware)
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
@@ -42,6 +58,35 @@ app.include_router(counsellor_router)
 # Academic Head (Level-2) OD approval routes
 app.include_router(academic_head_router)
 
+# Admin monitoring routes
+app.include_router(admin_metrics_router)
+app.include_router(admin_exports_router)
+app.include_router(admin_analytics_router)
+app.include_router(admin_roster_router)
+app.include_router(admin_provisioning_router)
+
+@app.on_event("startup")
+def start_email_outbox():
+    email_outbox.start()
+
+
+@app.on_event("startup")
+def start_sweeper():
+    if SWEEP_ENABLED:
+        sweeper.start()
+
+
+@app.on_event("shutdown")
+async def drain_admission_queues():
+    await admission.drain()
+
+
+@app.on_event("shutdown")
+def shutdown_background_workers():
+    email_outbox.stop()
+    sweeper.stop()
+    password_pool.shutdown()
+
 # Root route for testing
 @app.get("/")
 def read_root():
@@ -0,0 +1,115 @@
+# app/middleware/query_counter.py
+import logging
+import time
+from contextvars import ContextVar
+from os import getenv
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Default number of SQL statements a single request may issue
+DB_QUERY_BUDGET = int(getenv("DB_QUERY_BUDGET", 10))
+# When true (e.g. in CI), a request over budget fails instead of just warning
+DB_QUERY_BUDGET_STRICT = getenv("DB_QUERY_BUDGET_STRICT", "false").lower() in ("1", "true", "yes")
+
+# Per-route budgets, keyed by "<METHOD> <route path>"
+ROUTE_QUERY_BUDGETS = {
+    # Worst case: surge flag and L1 load snapshot both expired, lookup, INSERT,
+    # load adjust, version bump
+    "POST /student/od/apply": 6,
+    # Version lookup for the ETag, then the page
+    "GET /faculty/od/counsellor/pending": 2,
+    "POST /faculty/od/counsellor/{app_id}/approve": 5,
+    "POST /faculty/od/counsellor/{app_id}/reject": 5,
+    "GET /faculty/od/academic-head/pending": 2,
+    "POST /faculty/od/academic-head/{app_id}/approve": 6,
+    "POST /faculty/od/academic-head/{app_id}/reject": 4,
+}
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class QueryStats:
+    """SQL statements issued and time spent in the database for one request."""
+    __slots__ = ("count", "duration")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += time.perf_counter() - context._query_start_time
+
+
+def install_query_counter(engine):
+    """Attach the statement counters to a (sync) Engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _route_key(scope) -> str:
+    route = scope.get("route")
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+def _check_budget(scope, stats: QueryStats):
+    key = _route_key(scope)
+    budget = ROUTE_QUERY_BUDGETS.get(key, DB_QUERY_BUDGET)
+    logger.debug("%s: %d queries, %.2f ms in DB", key, stats.count, stats.duration * 1000)
+    if stats.count <= budget:
+        return
+    message = f"{key} issued {stats.count} queries (budget {budget})"
+    if DB_QUERY_BUDGET_STRICT:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+class QueryCounterMiddleware:
+    """
+    Counts SQL statements and DB time per request, reports them in the
+    X-DB-Query-Count / X-DB-Time-Ms response headers and enforces the
+    per-route query budget.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start":
+                _check_budget(scope, stats)
+                headers = MutableHeaders(scope=message)
+                headers.append("X-DB-Query-Count", str(stats.count))
+                headers.append("X-DB-Time-Ms", f"{stats.duration * 1000:.2f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
@@ -0,0 +1,34 @@
+# app/models/admission_ticket.py
+from sqlalchemy import Column, String, Enum, ForeignKey, TIMESTAMP, Index
+from app.database import Base
+from datetime import datetime
+import enum
+
+class TicketStatusEnum(str, enum.Enum):
+    QUEUED = "QUEUED"
+    ACCEPTED = "ACCEPTED"
+    REJECTED = "REJECTED"
+
+class AdmissionTicketRecord(Base):
+    """
+    Durable copy of a surge-mode admission ticket, so a poll answered by any
+    worker process sees the outcome decided by the worker that queued it.
+    """
+    __tablename__ = "admission_tickets"
+
+    ticket_id = Column(String(36), primary_key=True)
+    event_id = Column(
+        String(36),
+        ForeignKey("events.event_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    registration_number = Column(String(20), nullable=False)
+    status = Column(Enum(TicketStatusEnum), default=TicketStatusEnum.QUEUED, nullable=False)
+    detail = Column(String(255))
+    application_id = Column(String(36))
+    created_at = Column(TIMESTAMP, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Sweeper: tickets past their TTL
+        Index("ix_admission_tickets_created", "created_at"),
+    )
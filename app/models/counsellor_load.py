@@ -0,0 +1,22 @@
+# app/models/counsellor_load.py
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Index
+from app.database import Base
+
+class CounsellorLoad(Base):
+    """
+    Live Level-1 queue depth per counsellor, kept up to date by the writes
+    that add or remove pending work, so routing never has to count the queue.
+    """
+    __tablename__ = "counsellor_loads"
+
+    counsellor_id = Column(
+        String(20), ForeignKey("faculty.faculty_id", ondelete="CASCADE"), primary_key=True
+    )
+    department = Column(String(100))
+    pending = Column(Integer, nullable=False, default=0)
+    # False while the counsellor is away; new and rebalanced work skips them
+    accepting = Column(Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        Index("ix_counsellor_loads_department", "department", "pending"),
+    )
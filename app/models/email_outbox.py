@@ -0,0 +1,32 @@
+# app/models/email_outbox.py
+from sqlalchemy import Column, Integer, String, Text, Enum, TIMESTAMP, Index
+from app.database import Base
+from datetime import datetime
+import enum
+
+class OutboxStatusEnum(str, enum.Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(Enum(OutboxStatusEnum), default=OutboxStatusEnum.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    # When the row is next due; while a worker holds it, the end of its lease
+    next_attempt_at = Column(TIMESTAMP, default=datetime.utcnow, nullable=False)
+    claimed_by = Column(String(36))
+    last_error = Column(Text)
+    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    sent_at = Column(TIMESTAMP)
+
+    __table_args__ = (
+        # Outbox worker: due PENDING rows in order
+        Index("ix_email_outbox_due", "status", "next_attempt_at"),
+        Index("ix_email_outbox_claimed_by", "claimed_by"),
+    )
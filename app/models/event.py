@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Date, Integer, Enum as SAEnum, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, String, Text, Date, Integer, Boolean, Enum as SAEnum, ForeignKey, TIMESTAMP, Index
 from app.database import Base
 from datetime import datetime
 from enum import Enum  # ✅ Use Python Enum for the status values
@@ -21,6 +21,15 @@ class Event(Base):
     remaining_seats = Column(Integer, nullable=False)
     # ✅ Use SQLAlchemy Enum with alias SAEnum
     status = Column(SAEnum(EventStatusEnum, name="event_status_enum"), default=EventStatusEnum.OPEN)
+    # Opt-in: applications go through the per-event admission queue
+    surge_mode = Column(Boolean, default=False, nullable=False)
 
     created_by = Column(String(20), ForeignKey("faculty.faculty_id", ondelete="CASCADE"))
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Faculty's own events: get_faculty_events, paged by created_at
+        Index("ix_events_created_by_created", "created_by", "created_at"),
+        # Sweeper: events whose date has passed but are not CLOSED yet
+        Index("ix_events_status_date", "status", "date"),
+    )
@@ -1,5 +1,5 @@
 # app/models/event_request.py
-from sqlalchemy import Column, String, Text, Date, Enum, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, String, Text, Date, Enum, ForeignKey, TIMESTAMP, Index
 from app.database import Base
 from datetime import datetime
 import enum
@@ -21,3 +21,8 @@ class EventRequest(Base):
     reviewed_by = Column(String(20), ForeignKey("faculty.faculty_id", ondelete="SET NULL"))
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
     decision_at = Column(TIMESTAMP)
+
+    __table_args__ = (
+        # Pending review queue: list_pending_requests, paged by created_at
+        Index("ix_event_requests_status_created", "status", "created_at"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, TIMESTAMP, UniqueConstraint, Enum
+from sqlalchemy import Column, String, ForeignKey, TIMESTAMP, UniqueConstraint, Enum, Index
 from app.database import Base
 from datetime import datetime
 import enum
@@ -10,12 +10,15 @@ class ApplicationStatusEnum(str, enum.Enum):
     L1_REJECTED = "L1_REJECTED"
     L2_APPROVED = "L2_APPROVED"
     L2_REJECTED = "L2_REJECTED"
+    # Still undecided well after the event took place (set by the sweeper)
+    EXPIRED = "EXPIRED"
 
 
 class DecisionEnum(str, enum.Enum):
     PENDING = "PENDING"
     APPROVED = "APPROVED"
     REJECTED = "REJECTED"
+    EXPIRED = "EXPIRED"
 
 
 class ODApplication(Base):
@@ -47,7 +50,17 @@ class ODApplication(Base):
     level2_decision_at = Column(TIMESTAMP)
 
     applied_at = Column(TIMESTAMP, default=datetime.utcnow)
+    # Student's department at apply time; partitions the Academic Head queue
+    department = Column(String(100))
 
     __table_args__ = (
         UniqueConstraint("registration_number", "event_id", name="unique_student_event"),
+        # Counsellor queue: list_pending_l1 / decide_l1, paged by applied_at
+        Index("ix_od_applications_l1_queue_applied", "level1_approver_id", "level1_decision", "applied_at"),
+        # Academic Head queue: list_pending_l2 / decide_l2, paged by applied_at
+        Index("ix_od_applications_l2_queue_applied", "status", "level2_decision", "applied_at"),
+        # One department's Academic Head queue: list_pending_l2(department=...)
+        Index("ix_od_applications_l2_dept_queue", "department", "status", "level2_decision", "applied_at"),
+        # Student's own applications, paged by applied_at
+        Index("ix_od_applications_student_applied", "registration_number", "applied_at"),
     )
@@ -0,0 +1,29 @@
+# app/models/od_roster.py
+from sqlalchemy import Column, String, Date, ForeignKey, Index
+from app.database import Base
+
+class ODRoster(Base):
+    """
+    One row per L2-approved application, keyed by the event's date, so a
+    day's (or week's) on-duty roster is an index range scan. Written by the
+    L2 approval itself and moved when the event is rescheduled.
+    """
+    __tablename__ = "od_roster"
+
+    application_id = Column(
+        String(36),
+        ForeignKey("od_applications.application_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    registration_number = Column(String(20), nullable=False)
+    event_id = Column(
+        String(36),
+        ForeignKey("events.event_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_date = Column(Date, nullable=False)
+
+    __table_args__ = (
+        # Roster for a date range: get_roster / stream_roster
+        Index("ix_od_roster_date_student", "event_date", "registration_number"),
+    )
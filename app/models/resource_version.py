@@ -0,0 +1,10 @@
+# app/models/resource_version.py
+from sqlalchemy import Column, String, BigInteger
+from app.database import Base
+
+class ResourceVersion(Base):
+    """Change counter per listing (an approver's queue, a student's applications)."""
+    __tablename__ = "resource_versions"
+
+    key = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -1,5 +1,5 @@
 # app/models/user_otp.py
-from sqlalchemy import Column, Integer, String, Enum, Boolean, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Enum, Boolean, TIMESTAMP, Index
 from app.database import Base
 from datetime import datetime
 import enum
@@ -18,3 +18,8 @@ class UserOTP(Base):
     otp_expiry = Column(TIMESTAMP, nullable=False)
     is_used = Column(Boolean, default=False)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+
+    __table_args__ = (
+        # OTP verify / change / reset lookups and the unused-OTP cleanup on login
+        Index("ix_user_otps_lookup", "email", "role", "is_used", "otp_code"),
+    )
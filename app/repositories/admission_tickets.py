@@ -0,0 +1,57 @@
+# app/repositories/admission_tickets.py
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.orm import Session
+
+from app.models.admission_ticket import AdmissionTicketRecord, TicketStatusEnum
+from app.models.od_application import ODApplication
+
+
+def create_many(db: Session, tickets: List[dict]):
+    """Store QUEUED tickets (ticket_id, event_id, registration_number) with one INSERT."""
+    if not tickets:
+        return
+    now = datetime.utcnow()
+    db.execute(insert(AdmissionTicketRecord.__table__), [
+        {**ticket, "status": TicketStatusEnum.QUEUED, "created_at": now} for ticket in tickets
+    ])
+    db.commit()
+
+
+def record_outcomes(db: Session, outcomes: List[dict]):
+    """
+    Store each ticket's result with one executemany UPDATE. `outcomes` items
+    carry b_ticket_id, b_status, b_detail and b_application_id.
+    """
+    if not outcomes:
+        return
+    table = AdmissionTicketRecord.__table__
+    db.execute(
+        update(table)
+          .where(table.c.ticket_id == bindparam("b_ticket_id"))
+          .values(status=bindparam("b_status"), detail=bindparam("b_detail"),
+                  application_id=bindparam("b_application_id")),
+        outcomes,
+    )
+    db.commit()
+
+
+def get(
+    db: Session,
+    ticket_id: str,
+    registration_number: str
+) -> Optional[Tuple[AdmissionTicketRecord, Optional[ODApplication]]]:
+    """The student's ticket and, once accepted, its application, in one query."""
+    return (
+        db.query(AdmissionTicketRecord, ODApplication)
+          .outerjoin(ODApplication,
+                     ODApplication.application_id == AdmissionTicketRecord.application_id)
+          .filter(
+              AdmissionTicketRecord.ticket_id == ticket_id,
+              AdmissionTicketRecord.registration_number == registration_number
+          )
+          .first()
+    )
@@ -0,0 +1,87 @@
+# app/repositories/counsellor_loads.py
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam, case, func, update
+from sqlalchemy.orm import Session
+
+from app.models.counsellor_load import CounsellorLoad
+from app.models.faculty import Faculty
+from app.models.od_application import ODApplication, DecisionEnum
+from app.repositories.provisioning import upsert
+
+COUNSELLOR_DESIGNATION = "Counsellor"
+
+
+def adjust(db: Session, deltas: Dict[str, int]):
+    """Add each counsellor's delta to their pending count (never below zero) in one executemany."""
+    params = [
+        {"b_counsellor_id": counsellor_id, "b_delta": delta}
+        for counsellor_id, delta in sorted(deltas.items())
+        if counsellor_id and delta
+    ]
+    if not params:
+        return
+    table = CounsellorLoad.__table__
+    new_pending = table.c.pending + bindparam("b_delta")
+    db.execute(
+        update(table)
+          .where(table.c.counsellor_id == bindparam("b_counsellor_id"))
+          .values(pending=case((new_pending < 0, 0), else_=new_pending)),
+        params,
+    )
+
+
+def loads(db: Session, department: Optional[str] = None) -> List[CounsellorLoad]:
+    query = db.query(CounsellorLoad.counsellor_id, CounsellorLoad.department,
+                     CounsellorLoad.pending, CounsellorLoad.accepting)
+    if department:
+        query = query.filter(CounsellorLoad.department == department)
+    return query.all()
+
+
+def set_accepting(db: Session, counsellor_id: str, accepting: bool) -> bool:
+    updated = (
+        db.query(CounsellorLoad)
+          .filter(CounsellorLoad.counsellor_id == counsellor_id)
+          .update({CounsellorLoad.accepting: accepting}, synchronize_session=False)
+    )
+    return updated == 1
+
+
+def register(db: Session, faculty_rows: List[dict]):
+    """Add load rows for newly provisioned counsellors and keep departments current."""
+    rows = [
+        {"counsellor_id": row["faculty_id"], "department": row.get("department"),
+         "pending": 0, "accepting": True}
+        for row in faculty_rows
+        if row.get("designation") == COUNSELLOR_DESIGNATION
+    ]
+    if rows:
+        upsert(db, CounsellorLoad.__table__, rows, "counsellor_id", ["department"])
+
+
+def recount(db: Session) -> dict:
+    """
+    (Re)seed a row for every counsellor from one grouped count of pending
+    Level-1 work, repairing any drift. Availability flags are kept.
+    """
+    pending = dict(
+        db.query(ODApplication.level1_approver_id, func.count())
+          .filter(ODApplication.level1_decision == DecisionEnum.PENDING)
+          .group_by(ODApplication.level1_approver_id)
+          .all()
+    )
+    counsellors = (
+        db.query(Faculty.faculty_id, Faculty.department)
+          .filter(Faculty.designation == COUNSELLOR_DESIGNATION)
+          .all()
+    )
+    rows = [
+        {"counsellor_id": c.faculty_id, "department": c.department,
+         "pending": pending.get(c.faculty_id, 0), "accepting": True}
+        for c in counsellors
+    ]
+    upsert(db, CounsellorLoad.__table__, rows, "counsellor_id", ["department", "pending"])
+    db.commit()
+    return {"counsellors": len(rows), "pending": sum(r["pending"] for r in rows)}
@@ -0,0 +1,83 @@
+# app/repositories/counsellor_mappings.py
+"""
+Student -> (counsellor, department) lookups for the apply path, behind a
+process-local TTL cache. A student without a department is routed under
+their counsellor's, so the application still reaches a department queue.
+Mappings change about once a semester; the importer invalidates the keys it
+writes (everything on a faculty import), and the TTL bounds staleness in
+other worker processes.
+"""
+
+from os import getenv
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.faculty import Faculty
+from app.models.faculty_student_mapping import FacultyStudentMapping
+from app.models.student import Student
+from app.utils.ttl_cache import TTLCache
+
+load_dotenv()
+
+COUNSELLOR_CACHE_SIZE = int(getenv("COUNSELLOR_CACHE_SIZE", 50000))
+COUNSELLOR_CACHE_TTL_SECONDS = float(getenv("COUNSELLOR_CACHE_TTL_SECONDS", 600))
+
+
+class StudentRouting(NamedTuple):
+    counsellor_id: str
+    department: Optional[str]
+
+
+counsellor_cache = TTLCache(COUNSELLOR_CACHE_SIZE, COUNSELLOR_CACHE_TTL_SECONDS)
+
+# Queries selecting it must outer-join Faculty on the mapped counsellor
+ROUTING_DEPARTMENT = func.coalesce(Student.department, Faculty.department).label("department")
+
+
+def _routing_query(db: Session):
+    return (
+        db.query(FacultyStudentMapping.registration_number,
+                 FacultyStudentMapping.counsellor_id,
+                 ROUTING_DEPARTMENT)
+          .join(Student, Student.registration_number == FacultyStudentMapping.registration_number)
+          .outerjoin(Faculty, Faculty.faculty_id == FacultyStudentMapping.counsellor_id)
+          .filter(FacultyStudentMapping.counsellor_id.isnot(None))
+    )
+
+
+def get_routing(db: Session, registration_number: str) -> Optional[StudentRouting]:
+    routing = counsellor_cache.get(registration_number)
+    if routing is None:
+        row = (
+            _routing_query(db)
+              .filter(FacultyStudentMapping.registration_number == registration_number)
+              .first()
+        )
+        if row is not None:
+            routing = StudentRouting(row.counsellor_id, row.department)
+            counsellor_cache.put(registration_number, routing)
+    return routing
+
+
+def get_routings(db: Session, registration_numbers: Iterable[str]) -> Dict[str, StudentRouting]:
+    """Mapped students only; one query for whatever the cache does not hold."""
+    registration_numbers = list(dict.fromkeys(registration_numbers))
+    routings = counsellor_cache.get_many(registration_numbers)
+    missing = [reg_no for reg_no in registration_numbers if reg_no not in routings]
+    if missing:
+        loaded = {
+            row.registration_number: StudentRouting(row.counsellor_id, row.department)
+            for row in _routing_query(db)
+                         .filter(FacultyStudentMapping.registration_number.in_(missing))
+                         .all()
+        }
+        counsellor_cache.put_many(loaded)
+        routings.update(loaded)
+    return routings
+
+
+def invalidate(registration_numbers: Optional[Iterable[str]] = None):
+    counsellor_cache.invalidate(registration_numbers)
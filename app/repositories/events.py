@@ -1,10 +1,32 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import case, func, literal, or_, select
 from sqlalchemy.orm import Session
-from app.models.event import Event
-from app.schemas.event import EventCreate, EventUpdate  # ✅ Import EventUpdate
+from app.models.event import Event, EventStatusEnum
+from app.schemas.event import EventCreate, EventResponse, EventUpdate  # ✅ Import EventUpdate
+from app.repositories import roster as roster_repo
+from app.utils.pagination import DEFAULT_PAGE_SIZE, filter_range, paginate
 import uuid
 
-def get_faculty_events(db: Session, faculty_id: str):
-    return db.query(Event).filter(Event.created_by == faculty_id).all()
+# Listing projection: the response fields, then created_at for the page cursor
+LIST_FIELDS = tuple(EventResponse.__fields__)
+LIST_COLUMNS = [getattr(Event, name) for name in LIST_FIELDS] + [Event.created_at]
+
+def get_faculty_events(
+    db: Session,
+    faculty_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    event_status: Optional[EventStatusEnum] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    query = db.query(*LIST_COLUMNS).filter(Event.created_by == faculty_id)
+    if event_status:
+        query = query.filter(Event.status == event_status)
+    query = filter_range(query, Event.created_at, since, until)
+    return paginate(query, Event.created_at, Event.event_id, cursor, limit)
 
 def create_event(db: Session, faculty_id: str, event_data: EventCreate):
     new_event = Event(
@@ -14,6 +36,8 @@ def create_event(db: Session, faculty_id: str, event_data: EventCreate):
         date=event_data.date,
         location=event_data.location,
         seat_limit=event_data.seat_limit,
+        remaining_seats=event_data.seat_limit,
+        surge_mode=event_data.surge_mode,
         created_by=faculty_id
     )
     db.add(new_event)
@@ -24,24 +48,131 @@ def create_event(db: Session, faculty_id: str, event_data: EventCreate):
 def get_event_by_id(db: Session, event_id: str):
     return db.query(Event).filter(Event.event_id == event_id).first()
 
+def is_surge_mode(db: Session, event_id: str) -> bool:
+    return bool(
+        db.query(Event.surge_mode)
+          .filter(Event.event_id == event_id)
+          .scalar()
+    )
+
+def _seat_change_values(delta: int):
+    """
+    Ordered SET clause adding `delta` seats (negative to take seats) and
+    moving OPEN <-> FILLED to match. `status` is listed first so that every
+    backend computes it from the old remaining_seats (MySQL applies SET
+    assignments left to right). CLOSED events keep their status.
+    """
+    status_type = Event.__table__.c.status.type
+    new_remaining = Event.remaining_seats + delta
+    return [
+        (Event.status, case(
+            (Event.status == EventStatusEnum.CLOSED, Event.status),
+            (new_remaining <= 0, literal(EventStatusEnum.FILLED, status_type)),
+            else_=literal(EventStatusEnum.OPEN, status_type),
+        )),
+        (Event.remaining_seats, new_remaining),
+    ]
+
+def reserve_seat(db: Session, event_id: str, count: int = 1) -> bool:
+    """
+    Take `count` seats with a single conditional UPDATE, marking the event
+    FILLED in the same statement when it runs out.
+    Returns False when not enough seats are left (or the event is missing);
+    never oversubscribes.
+    """
+    taken = (
+        db.query(Event)
+          .filter(Event.event_id == event_id, Event.remaining_seats >= count)
+          .update(_seat_change_values(-count), synchronize_session=False,
+                  update_args={"preserve_parameter_order": True})
+    )
+    return taken == 1
+
+def reserve_seats_up_to(db: Session, event_id: str, wanted: int) -> int:
+    """
+    Take as many of `wanted` seats as are left, each attempt one conditional
+    UPDATE (no lock held in between). Returns how many were taken.
+    """
+    while wanted > 0:
+        if reserve_seat(db, event_id, wanted):
+            return wanted
+        left = db.query(Event.remaining_seats).filter(Event.event_id == event_id).scalar()
+        if not left or left <= 0:
+            return 0
+        wanted = min(wanted, left)
+    return 0
+
+def resize_event_seats(db: Session, event_id: str, delta: int) -> bool:
+    """
+    Shift remaining_seats (and fill status) after the seat limit changed by
+    `delta`. Returns False, changing nothing, when the seat limit would drop
+    below the seats already reserved.
+    """
+    resized = (
+        db.query(Event)
+          .filter(Event.event_id == event_id, Event.remaining_seats + delta >= 0)
+          .update(_seat_change_values(delta), synchronize_session=False,
+                  update_args={"preserve_parameter_order": True})
+    )
+    return resized == 1
+
 def delete_event(db: Session, event: Event):
     db.delete(event)
     db.commit()
 
 def update_event(db: Session, event: Event, data: EventUpdate):  # ✅ Now uses imported EventUpdate
-    for field, value in data.dict(exclude_unset=True).items():
+    fields = data.dict(exclude_unset=True)
+    new_limit = fields.get("seat_limit")
+    delta = new_limit - event.seat_limit if new_limit is not None else 0
+    if delta and not resize_event_seats(db, event.event_id, delta):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Seat limit is below the number of seats already reserved"
+        )
+    for field, value in fields.items():
         setattr(event, field, value)
+    if fields.get("date"):
+        # Rescheduled: the approved students are now on duty on the new date
+        roster_repo.move_event(db, event.event_id, fields["date"])
     db.commit()
     db.refresh(event)
     return event
 
-def update_event_status_if_filled(db: Session, event_id: str):
-    """Check applications count and update event status if seat limit reached"""
-    from app.models.od_application import ODApplication  # avoid circular import
-    event = db.query(Event).filter(Event.event_id == event_id).first()
-    if not event:
-        return
-    count = db.query(ODApplication).filter(ODApplication.event_id == event_id).count()
-    if count >= event.seat_limit and event.status != "FILLED":
-        event.status = "FILLED"
-        db.commit()
+def reconcile_event_seats(db: Session) -> dict:
+    """
+    Repair drift in remaining_seats / fill status for every event with one
+    UPDATE that counts each event's L2-approved applications while it holds
+    the event row, so a seat reserved while the job runs (which takes the
+    same row) is either counted or applied after the correction, never lost.
+    """
+    from app.models.od_application import ODApplication, ApplicationStatusEnum  # avoid circular import
+    status_type = Event.__table__.c.status.type
+    approved = (
+        select(func.count())
+          .where(
+              ODApplication.event_id == Event.event_id,
+              ODApplication.status == ApplicationStatusEnum.L2_APPROVED,
+          )
+          .scalar_subquery()
+    )
+    left = Event.seat_limit - approved
+    remaining = case((left > 0, left), else_=0)
+    new_status = case(
+        (Event.status == EventStatusEnum.CLOSED, Event.status),
+        (remaining <= 0, literal(EventStatusEnum.FILLED, status_type)),
+        else_=literal(EventStatusEnum.OPEN, status_type),
+    )
+
+    checked = db.query(func.count(Event.event_id)).scalar()
+    fixed = (
+        db.query(Event)
+          .filter(or_(Event.remaining_seats != remaining, Event.status != new_status))
+          .update(
+              [(Event.status, new_status), (Event.remaining_seats, remaining)],
+              synchronize_session=False,
+              update_args={"preserve_parameter_order": True},
+          )
+    )
+    db.commit()
+    return {"events_checked": checked, "events_fixed": fixed}
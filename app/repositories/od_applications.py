@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.models.od_application import ODApplication, ApplicationStatusEnum
-from app.models.faculty_student_mapping import FacultyStudentMapping
+from app.repositories import counsellor_mappings
 from app.schemas.od_application import ODApplicationCreate
 
 
@@ -15,12 +15,8 @@ def create_od_application(
     application: ODApplicationCreate
 ) -> ODApplication:
     # 1) Find the counsellor assigned to this student
-    mapping = (
-        db.query(FacultyStudentMapping)
-          .filter_by(registration_number=student_reg_no)
-          .first()
-    )
-    if not mapping:
+    routing = counsellor_mappings.get_routing(db, student_reg_no)
+    if not routing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No counsellor assigned to this student"
@@ -32,7 +28,8 @@ def create_od_application(
         registration_number=student_reg_no,
         event_id=application.event_id,
         status=ApplicationStatusEnum.PENDING,
-        level1_approver_id=mapping.counsellor_id
+        level1_approver_id=routing.counsellor_id,
+        department=routing.department
     )
     db.add(new_app)
     db.commit()
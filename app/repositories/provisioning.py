@@ -0,0 +1,63 @@
+# app/repositories/provisioning.py
+
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+
+def upsert(db: Session, table, rows: List[dict], key_column: str, update_columns: Iterable[str]):
+    """
+    Insert `rows` into `table` in one statement, updating `update_columns` of
+    existing keys. On MySQL any unique key can trigger the update, so callers
+    must drop rows that clash with another row's unique column first.
+    """
+    if not rows:
+        return
+    update_columns = list(update_columns)
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[key_column]],
+            set_={name: stmt.excluded[name] for name in update_columns},
+        )
+    else:
+        stmt = mysql_insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in update_columns})
+    db.execute(stmt)
+
+
+def update_existing(db: Session, table, rows: List[dict], key_column: str, update_columns: Iterable[str]):
+    """Update `update_columns` of rows already in `table`, one executemany UPDATE keyed by `key_column`."""
+    if not rows:
+        return
+    update_columns = list(update_columns)
+    stmt = (
+        update(table)
+          .where(table.c[key_column] == bindparam("b_key"))
+          .values({name: bindparam(f"b_{name}") for name in update_columns})
+    )
+    db.execute(stmt, [
+        {"b_key": row[key_column], **{f"b_{name}": row[name] for name in update_columns}}
+        for row in rows
+    ])
+
+
+def existing_keys(db: Session, column, keys: Iterable[str]) -> Set[str]:
+    keys = list(set(keys))
+    if not keys:
+        return set()
+    return {key for (key,) in db.query(column).filter(column.in_(keys)).all()}
+
+
+def owners(db: Session, key_column, column, values: Iterable[str]) -> Dict[str, str]:
+    """Key of the row holding each of `values` in unique `column`, by lower-cased value."""
+    values = list(set(values))
+    if not values:
+        return {}
+    return {
+        value.lower(): key
+        for key, value in db.query(key_column, column).filter(column.in_(values)).all()
+    }
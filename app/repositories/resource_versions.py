@@ -0,0 +1,76 @@
+# app/repositories/resource_versions.py
+"""
+Version counters behind the ETags of the queue and listing endpoints.
+Writers bump the affected keys in the same transaction as their change,
+so a conditional GET only needs one primary-key lookup to answer 304.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.resource_version import ResourceVersion
+
+# Per-department keys; institution-wide views read the sum over a prefix,
+# so writers in different departments never bump the same row
+L2_QUEUE_PREFIX = "l2:"
+# L1/L2 decisions; invalidate the approval latency report
+DECISIONS_PREFIX = "decisions:"
+NO_DEPARTMENT = "-"
+
+
+def l1_queue_key(counsellor_id: str) -> str:
+    return f"l1:{counsellor_id}"
+
+
+def student_key(registration_number: str) -> str:
+    return f"student:{registration_number}"
+
+
+def l2_queue_key(department: Optional[str]) -> str:
+    return f"{L2_QUEUE_PREFIX}{department or NO_DEPARTMENT}"
+
+
+def decisions_key(department: Optional[str]) -> str:
+    return f"{DECISIONS_PREFIX}{department or NO_DEPARTMENT}"
+
+
+def get_version(db: Session, key: str) -> int:
+    version = (
+        db.query(ResourceVersion.version)
+          .filter(ResourceVersion.key == key)
+          .scalar()
+    )
+    return version or 0
+
+
+def get_version_total(db: Session, prefix: str) -> int:
+    """Sum of every counter under `prefix`; changes whenever any of them is bumped."""
+    total = (
+        db.query(func.sum(ResourceVersion.version))
+          .filter(ResourceVersion.key.startswith(prefix, autoescape=True))
+          .scalar()
+    )
+    return int(total or 0)
+
+
+def bump_versions(db: Session, keys: Iterable[str]):
+    """Increment (creating if needed) every key with one upsert statement."""
+    keys = sorted({key for key in keys if key})
+    if not keys:
+        return
+    table = ResourceVersion.__table__
+    rows = [{"key": key, "version": 1} for key in keys]
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(table).values(rows).on_conflict_do_update(
+            index_elements=[table.c.key],
+            set_={"version": table.c.version + 1},
+        )
+    else:
+        stmt = mysql_insert(table).values(rows).on_duplicate_key_update(
+            version=table.c.version + 1
+        )
+    db.execute(stmt)
@@ -0,0 +1,60 @@
+# app/repositories/roster.py
+
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.models.od_application import ODApplication
+from app.models.od_roster import ODRoster
+from app.models.student import Student
+
+ROSTER_COLUMNS = [
+    ODRoster.event_date,
+    ODRoster.registration_number,
+    Student.name.label("student_name"),
+    Student.department.label("department"),
+    ODRoster.event_id,
+    Event.name.label("event_name"),
+    Event.location.label("event_location"),
+    ODRoster.application_id,
+]
+ROSTER_FIELDS = [column.key for column in ROSTER_COLUMNS]
+
+
+def add_approved(db: Session, application_ids: List[str]):
+    """Copy freshly L2-approved applications into the roster with one INSERT ... SELECT."""
+    if not application_ids:
+        return
+    rows = (
+        select(ODApplication.application_id, ODApplication.registration_number,
+               ODApplication.event_id, Event.date)
+          .join(Event, Event.event_id == ODApplication.event_id)
+          .where(ODApplication.application_id.in_(application_ids))
+    )
+    db.execute(
+        insert(ODRoster.__table__).from_select(
+            ["application_id", "registration_number", "event_id", "event_date"], rows
+        )
+    )
+
+
+def move_event(db: Session, event_id: str, new_date: date):
+    db.query(ODRoster)\
+      .filter(ODRoster.event_id == event_id)\
+      .update({ODRoster.event_date: new_date}, synchronize_session=False)
+
+
+def roster_query(db: Session, start: date, end: date, department: Optional[str] = None):
+    """Roster rows with start <= event_date < end, ordered by date and student."""
+    query = (
+        db.query(*ROSTER_COLUMNS)
+          .join(Student, Student.registration_number == ODRoster.registration_number)
+          .join(Event, Event.event_id == ODRoster.event_id)
+          .filter(ODRoster.event_date >= start, ODRoster.event_date < end)
+    )
+    if department:
+        query = query.filter(Student.department == department)
+    return query.order_by(ODRoster.event_date, ODRoster.registration_number, ODRoster.application_id)
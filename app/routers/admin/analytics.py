@@ -0,0 +1,25 @@
+# app/routers/admin/analytics.py
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.deps.auth import get_current_admin
+from app.services.approval_analytics import latency_reports
+
+router = APIRouter(
+    prefix="/admin/analytics",
+    tags=["Admin Analytics"]
+)
+
+
+@router.get(
+    "/approval-latency",
+    summary="p50/p90/p99 L1 and L2 turnaround per approver, department and month"
+)
+def read_approval_latency(
+    admin_id: str = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    # Served from cache until the next approval decision
+    return latency_reports.get(db)
@@ -0,0 +1,37 @@
+# app/routers/admin/exports.py
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.deps.auth import get_current_admin
+from app.models.od_application import ApplicationStatusEnum
+from app.services.od_exports import ExportFormatEnum, MEDIA_TYPES, stream_od_applications
+
+router = APIRouter(
+    prefix="/admin/exports",
+    tags=["Admin Exports"]
+)
+
+
+@router.get(
+    "/od-applications",
+    summary="Stream OD applications with student, event and approver names as NDJSON or CSV"
+)
+def export_od_applications(
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    department: Optional[str] = None,
+    status: Optional[ApplicationStatusEnum] = None,
+    admin_id: str = Depends(get_current_admin),
+):
+    # The body is generated row batch by row batch; nothing is buffered up front
+    filename = f"od_applications_{datetime.utcnow():%Y%m%d_%H%M%S}.{format.value}"
+    return StreamingResponse(
+        stream_od_applications(format, since=since, until=until, department=department, app_status=status),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,119 @@
+# app/routers/admin/metrics.py
+
+from fastapi import APIRouter, Depends
+
+from app.database import engine, async_engine
+from app.deps.auth import get_current_admin, token_cache
+from app.utils.pool_stats import pool_stats, async_pool_stats
+from app.utils.password_pool import password_pool
+from app.services.email_outbox import email_outbox
+from app.services.od_admission import admission
+from app.services.approval_analytics import latency_reports
+from app.repositories.counsellor_mappings import counsellor_cache
+from app.services.l1_routing import balancer
+from app.services.sweeper import sweeper
+
+router = APIRouter(
+    prefix="/admin/metrics",
+    tags=["Admin Metrics"]
+)
+
+
+@router.get(
+    "/db-pool",
+    summary="Live connection pool statistics"
+)
+def read_db_pool_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return pool_stats.snapshot(engine.pool)
+
+
+@router.get(
+    "/async-db-pool",
+    summary="Live statistics for the async engine's connection pool"
+)
+def read_async_db_pool_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return async_pool_stats.snapshot(async_engine.sync_engine.pool)
+
+
+@router.get(
+    "/token-cache",
+    summary="Size and hit rate of the verified-JWT cache"
+)
+def read_token_cache_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return token_cache.stats()
+
+
+@router.get(
+    "/password-pool",
+    summary="Queue depth and throughput of the bcrypt worker pool"
+)
+def read_password_pool_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return password_pool.stats()
+
+
+@router.get(
+    "/email-outbox",
+    summary="Email outbox delivery and SMTP connection statistics"
+)
+def read_email_outbox_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return email_outbox.stats()
+
+
+@router.get(
+    "/admission",
+    summary="Surge-mode admission queue depth and group-commit throughput"
+)
+def read_admission_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return admission.stats()
+
+
+@router.get(
+    "/latency-report",
+    summary="Approval latency report cache hits and the decisions version it was built at"
+)
+def read_latency_report_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return latency_reports.stats()
+
+
+@router.get(
+    "/counsellor-cache",
+    summary="Student-to-counsellor mapping cache size and hit rate"
+)
+def read_counsellor_cache_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return counsellor_cache.stats()
+
+
+@router.get(
+    "/l1-routing",
+    summary="Level-1 routing policy and how many applications went to a backup counsellor"
+)
+def read_l1_routing_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return balancer.stats()
+
+
+@router.get(
+    "/sweeper",
+    summary="Sweeper runs, last run's stats and rows closed, expired and purged so far"
+)
+def read_sweeper_stats(
+    admin_id: str = Depends(get_current_admin),
+):
+    return sweeper.stats()
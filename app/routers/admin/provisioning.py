@@ -0,0 +1,30 @@
+# app/routers/admin/provisioning.py
+
+import io
+
+from fastapi import APIRouter, Depends, File, UploadFile
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.deps.auth import get_current_admin
+from app.services.provisioning import ImportKindEnum, import_csv
+
+router = APIRouter(
+    prefix="/admin/import",
+    tags=["Admin Provisioning"]
+)
+
+
+@router.post(
+    "/{kind}",
+    summary="Bulk-create or update students, faculty or counsellor mappings from a CSV upload"
+)
+def import_accounts(
+    kind: ImportKindEnum,
+    file: UploadFile = File(...),
+    admin_id: str = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    # Import faculty and students before the mappings that reference them
+    source = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    return import_csv(db, kind, source)
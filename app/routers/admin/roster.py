@@ -0,0 +1,52 @@
+# app/routers/admin/roster.py
+
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.deps.auth import get_current_admin
+from app.services import roster as service
+from app.services.od_exports import ExportFormatEnum, MEDIA_TYPES
+
+router = APIRouter(
+    prefix="/admin/roster",
+    tags=["Admin Roster"]
+)
+
+
+@router.get(
+    "/",
+    summary="Students with L2-approved OD on a day (or up to a week from it)"
+)
+def get_roster(
+    day: date = Query(..., alias="date"),
+    days: int = Query(1, ge=1, le=service.MAX_ROSTER_DAYS),
+    department: Optional[str] = None,
+    admin_id: str = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    return ORJSONResponse(service.get_roster(db, day, days, department))
+
+
+@router.get(
+    "/export",
+    summary="Stream the roster for a date range as NDJSON or CSV for the attendance system"
+)
+def export_roster(
+    day: date = Query(..., alias="date"),
+    days: int = Query(1, ge=1, le=service.MAX_EXPORT_DAYS),
+    department: Optional[str] = None,
+    format: ExportFormatEnum = ExportFormatEnum.CSV,
+    admin_id: str = Depends(get_current_admin),
+):
+    body = service.stream_roster(format, day, days, department)
+    filename = f"od_roster_{day:%Y%m%d}_{days}d.{format.value}"
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
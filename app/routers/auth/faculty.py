@@ -15,7 +15,7 @@ from app.schemas.auth import (
     FacultyProfileResponse,
 )
 from app.utils.security import verify_password, hash_password, create_jwt_token
-from app.utils.email import send_otp_email
+from app.services.email_outbox import queue_otp_email
 from app.database import get_db
 from app.models.faculty import Faculty
 from app.models.user_otp import UserOTP, UserRoleEnum
@@ -49,7 +49,9 @@ def faculty_login(
         token = create_jwt_token(
             email=faculty.email,
             role="FACULTY",
-            user_id=faculty.faculty_id
+            user_id=faculty.faculty_id,
+            designation=faculty.designation,
+            department=faculty.department
         )
         return {
             "access_token": token,
@@ -71,9 +73,8 @@ def faculty_login(
         otp_code=otp,
         otp_expiry=expiry
     ))
+    queue_otp_email(db, faculty.email, otp)
     db.commit()
-
-    send_otp_email(faculty.email, otp)
     raise HTTPException(
         status_code=status.HTTP_202_ACCEPTED,
         detail="OTP sent to your college email. Please verify."
@@ -159,9 +160,8 @@ def forgot_password(
         otp_code=otp,
         otp_expiry=expiry
     ))
+    queue_otp_email(db, faculty.email, otp)
     db.commit()
-
-    send_otp_email(faculty.email, otp)
     return {"message": "OTP sent to your registered email."}
 
 
@@ -16,7 +16,7 @@ from app.schemas.auth import (
     StudentProfileResponse,
 )
 from app.utils.security import verify_password, hash_password, create_jwt_token
-from app.utils.email import send_otp_email
+from app.services.email_outbox import queue_otp_email
 from app.deps.auth import get_current_student
 
 router = APIRouter(
@@ -70,9 +70,8 @@ def student_login(
         otp_code=otp,
         otp_expiry=expiry
     ))
+    queue_otp_email(db, student.email, otp)
     db.commit()
-
-    send_otp_email(student.email, otp)
     raise HTTPException(
         status_code=status.HTTP_202_ACCEPTED,
         detail="OTP sent to your college email. Please verify."
@@ -159,9 +158,8 @@ def forgot_password(
         otp_code=otp,
         otp_expiry=expiry
     ))
+    queue_otp_email(db, student.email, otp)
     db.commit()
-
-    send_otp_email(student.email, otp)
     return {"message": "OTP sent to your registered email."}
 
 
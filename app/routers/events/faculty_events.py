@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import Optional
 
 from app.database import get_db
 from app.deps.auth import get_current_faculty
-from app.schemas.event import EventCreate, EventResponse, EventUpdate
+from app.models.event import EventStatusEnum
+from app.schemas.event import EventCreate, EventResponse, EventUpdate, EventPage
 from app.services import events as service
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
 
 router = APIRouter(
     prefix="/faculty/events",
@@ -14,15 +17,23 @@ router = APIRouter(
 
 @router.get(
     "/",
-    response_model=List[EventResponse],
-    summary="List all events created by this faculty"
+    response_model=EventPage,
+    summary="List events created by this faculty"
 )
 def get_faculty_events(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    status: Optional[EventStatusEnum] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     db: Session = Depends(get_db),
     faculty_id: str = Depends(get_current_faculty),
 ):
-    events = service.list_faculty_events(db, faculty_id)
-    return [EventResponse.from_orm(evt) for evt in events]
+    rows, next_cursor = service.list_faculty_events(
+        db, faculty_id,
+        cursor=cursor, limit=limit, event_status=status, since=since, until=until,
+    )
+    return page_response(service.LIST_FIELDS, rows, next_cursor)
 
 @router.post(
     "/",
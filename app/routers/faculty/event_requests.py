@@ -1,14 +1,16 @@
 # app/routers/faculty/event_requests.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from datetime import datetime
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.services.event_requests import review_event_request
 from app.database import get_db
 from app.deps.auth import get_current_faculty
 from app.models.faculty import Faculty
-from app.schemas.event_request import EventRequestResponse
+from app.schemas.event_request import EventRequestResponse, EventRequestPage
 from app.services.event_requests import list_pending_requests
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(
     prefix="/faculty/event-requests",
@@ -18,10 +20,14 @@ router = APIRouter(
 
 @router.get(
     "/pending",
-    response_model=List[EventRequestResponse],
-    summary="List all student event requests awaiting review"
+    response_model=EventRequestPage,
+    summary="List student event requests awaiting review"
 )
 def list_pending_event_requests(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     faculty_id: str = Depends(get_current_faculty),
     db: Session = Depends(get_db),
 ):
@@ -33,7 +39,10 @@ def list_pending_event_requests(
             detail="Access denied"
         )
 
-    return list_pending_requests(db)
+    items, next_cursor = list_pending_requests(
+        db, cursor=cursor, limit=limit, since=since, until=until
+    )
+    return {"items": items, "next_cursor": next_cursor}
 
 @router.post(
     "/{request_id}/approve",
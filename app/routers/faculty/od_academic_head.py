@@ -1,12 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional
 
-from app.database import get_db
-from app.deps.auth import get_current_faculty
-from app.models.faculty import Faculty
-from app.schemas.od_application import ODApplicationResponse
-from app.services.od_applications import list_pending_l2, decide_l2
+from app.database import async_get_db
+from app.deps.auth import get_faculty_department, require_academic_head
+from app.schemas.od_application import (
+    ODApplicationResponse,
+    ODApplicationPage,
+    ODBulkDecisionRequest,
+    ODBulkDecisionResult,
+)
+from app.services.od_applications import LIST_FIELDS
+from app.services.od_applications_async import (
+    get_version,
+    get_version_total,
+    list_pending_l2,
+    decide_l2,
+    decide_l2_bulk,
+)
+from app.services.queue_events import L2_CHANNEL, l2_channel, sse_stream
+from app.repositories import resource_versions as versions
+from app.utils.etag import is_not_modified, make_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
 
 router = APIRouter(
     prefix="/faculty/od/academic-head",
@@ -15,44 +32,97 @@ router = APIRouter(
 
 @router.get(
     "/pending",
-    response_model=List[ODApplicationResponse],
+    response_model=ODApplicationPage,
     summary="List OD applications approved by counsellors (awaiting Academic Head approval)"
 )
-def list_pending(
-    faculty_id: str = Depends(get_current_faculty),
-    db: Session = Depends(get_db),
+async def list_pending(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    event_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    faculty_id: str = Depends(require_academic_head),
+    department: Optional[str] = Depends(get_faculty_department),
+    db: AsyncSession = Depends(async_get_db),
+):
+    # Cheap revalidation: one version lookup decides 304 before the queue is read
+    if department:
+        version = await get_version(db, versions.l2_queue_key(department))
+    else:
+        version = await get_version_total(db, versions.L2_QUEUE_PREFIX)
+    etag = make_etag(version, request)
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    # Return one page of L1-approved, L2-pending applications from the head's
+    # department (the whole institution for heads without one)
+    rows, next_cursor = await list_pending_l2(
+        db, department=department, cursor=cursor, limit=limit, event_id=event_id, since=since, until=until,
+    )
+    return page_response(LIST_FIELDS, rows, next_cursor, headers)
+
+@router.get(
+    "/stream",
+    summary="Server-Sent Events stream of changes to the Academic Head queue"
+)
+async def stream_queue(
+    request: Request,
+    faculty_id: str = Depends(require_academic_head),
+    department: Optional[str] = Depends(get_faculty_department),
 ):
-    # 1) Ensure this user is an Academic Head
-    faculty = db.query(Faculty).get(faculty_id)
-    if not faculty or faculty.designation != "Academic Head":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: not an Academic Head"
-        )
+    # Deltas: created / decided / cancelled (and resync when the client falls behind)
+    return StreamingResponse(
+        sse_stream(request, l2_channel(department) if department else L2_CHANNEL),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/bulk/approve",
+    response_model=List[ODBulkDecisionResult],
+    summary="Academic Head approves several OD applications at once"
+)
+async def bulk_approve(
+    request: ODBulkDecisionRequest,
+    faculty_id: str = Depends(require_academic_head),
+    department: Optional[str] = Depends(get_faculty_department),
+    db: AsyncSession = Depends(async_get_db),
+):
+    # Level-2 approval of the whole batch in one transaction
+    return await decide_l2_bulk(db, request.application_ids, faculty_id, approve=True, department=department)
+
+
+@router.post(
+    "/bulk/reject",
+    response_model=List[ODBulkDecisionResult],
+    summary="Academic Head rejects several OD applications at once"
+)
+async def bulk_reject(
+    request: ODBulkDecisionRequest,
+    faculty_id: str = Depends(require_academic_head),
+    department: Optional[str] = Depends(get_faculty_department),
+    db: AsyncSession = Depends(async_get_db),
+):
+    # Level-2 rejection of the whole batch in one transaction
+    return await decide_l2_bulk(db, request.application_ids, faculty_id, approve=False, department=department)
 
-    # 2) Return all L1-approved, L2-pending applications
-    return list_pending_l2(db)
 
 @router.post(
     "/{app_id}/approve",
     response_model=ODApplicationResponse,
     summary="Academic Head approves an OD application"
 )
-def approve(
+async def approve(
     app_id: str,
-    faculty_id: str = Depends(get_current_faculty),
-    db: Session = Depends(get_db),
+    faculty_id: str = Depends(require_academic_head),
+    department: Optional[str] = Depends(get_faculty_department),
+    db: AsyncSession = Depends(async_get_db),
 ):
-    # verify Academic Head role
-    faculty = db.query(Faculty).get(faculty_id)
-    if not faculty or faculty.designation != "Academic Head":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: not an Academic Head"
-        )
-
     # perform Level-2 approval
-    return decide_l2(db, app_id, faculty_id, approve=True)
+    return await decide_l2(db, app_id, faculty_id, approve=True, department=department)
 
 
 @router.post(
@@ -60,18 +130,11 @@ def approve(
     response_model=ODApplicationResponse,
     summary="Academic Head rejects an OD application"
 )
-def reject(
+async def reject(
     app_id: str,
-    faculty_id: str = Depends(get_current_faculty),
-    db: Session = Depends(get_db),
+    faculty_id: str = Depends(require_academic_head),
+    department: Optional[str] = Depends(get_faculty_department),
+    db: AsyncSession = Depends(async_get_db),
 ):
-    # verify Academic Head role
-    faculty = db.query(Faculty).get(faculty_id)
-    if not faculty or faculty.designation != "Academic Head":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: not an Academic Head"
-        )
-
     # perform Level-2 rejection
-    return decide_l2(db, app_id, faculty_id, approve=False)
+    return await decide_l2(db, app_id, faculty_id, approve=False, department=department)
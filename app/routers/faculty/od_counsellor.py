@@ -1,17 +1,31 @@
 # app/routers/od_counsellor.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-
-from app.database import get_db
-from app.deps.auth import get_current_faculty
-from app.models.faculty import Faculty
-from app.schemas.od_application import ODApplicationResponse
-from app.services.od_applications import (
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional
+
+from app.database import async_get_db
+from app.deps.auth import require_counsellor
+from app.schemas.od_application import (
+    ODApplicationResponse,
+    ODApplicationPage,
+    ODBulkDecisionRequest,
+    ODBulkDecisionResult,
+)
+from app.services.od_applications import LIST_FIELDS
+from app.services.od_applications_async import (
+    get_version,
     list_pending_l1,
     decide_l1,
+    decide_l1_bulk,
+    set_availability,
 )
+from app.services.queue_events import l1_channel, sse_stream
+from app.repositories import resource_versions as versions
+from app.utils.etag import is_not_modified, make_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
 
 router = APIRouter(
     prefix="/faculty/od/counsellor",
@@ -20,23 +34,88 @@ router = APIRouter(
 
 @router.get(
     "/pending",
-    response_model=List[ODApplicationResponse],
+    response_model=ODApplicationPage,
     summary="List pending OD applications for this counsellor"
 )
-def list_pending(
-    faculty_id: str = Depends(get_current_faculty),
-    db: Session = Depends(get_db),
+async def list_pending(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    event_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    faculty_id: str = Depends(require_counsellor),
+    db: AsyncSession = Depends(async_get_db),
+):
+    # Cheap revalidation: one version lookup decides 304 before the queue is read
+    etag = make_etag(await get_version(db, versions.l1_queue_key(faculty_id)), request)
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    # Fetch one page of pending applications assigned to this counsellor
+    rows, next_cursor = await list_pending_l1(
+        db, faculty_id,
+        cursor=cursor, limit=limit, event_id=event_id, since=since, until=until,
+    )
+    return page_response(LIST_FIELDS, rows, next_cursor, headers)
+
+
+@router.get(
+    "/stream",
+    summary="Server-Sent Events stream of changes to this counsellor's queue"
+)
+async def stream_queue(
+    request: Request,
+    faculty_id: str = Depends(require_counsellor),
+):
+    # Deltas: created / decided / cancelled (and resync when the client falls behind)
+    return StreamingResponse(
+        sse_stream(request, l1_channel(faculty_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/availability",
+    summary="Counsellor marks themselves away or back; away queues move to colleagues"
+)
+async def update_availability(
+    accepting: bool = Query(...),
+    faculty_id: str = Depends(require_counsellor),
+    db: AsyncSession = Depends(async_get_db),
+):
+    # Stop (or resume) receiving new applications; going away hands off pending ones
+    return await set_availability(db, faculty_id, accepting)
+
+
+@router.post(
+    "/bulk/approve",
+    response_model=List[ODBulkDecisionResult],
+    summary="Counsellor approves several OD applications at once"
+)
+async def bulk_approve(
+    request: ODBulkDecisionRequest,
+    faculty_id: str = Depends(require_counsellor),
+    db: AsyncSession = Depends(async_get_db),
 ):
-    # 1) Confirm this user is a counsellor
-    faculty = db.query(Faculty).get(faculty_id)
-    if not faculty or faculty.designation != "Counsellor":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: not a counsellor"
-        )
+    # Level-1 approval of the whole batch in one transaction
+    return await decide_l1_bulk(db, request.application_ids, faculty_id, approve=True)
 
-    # 2) Fetch pending applications assigned to them
-    return list_pending_l1(db, faculty_id)
+
+@router.post(
+    "/bulk/reject",
+    response_model=List[ODBulkDecisionResult],
+    summary="Counsellor rejects several OD applications at once"
+)
+async def bulk_reject(
+    request: ODBulkDecisionRequest,
+    faculty_id: str = Depends(require_counsellor),
+    db: AsyncSession = Depends(async_get_db),
+):
+    # Level-1 rejection of the whole batch in one transaction
+    return await decide_l1_bulk(db, request.application_ids, faculty_id, approve=False)
 
 
 @router.post(
@@ -44,21 +123,13 @@ def list_pending(
     response_model=ODApplicationResponse,
     summary="Counsellor approves an OD application"
 )
-def approve(
+async def approve(
     app_id: str,
-    faculty_id: str = Depends(get_current_faculty),
-    db: Session = Depends(get_db),
+    faculty_id: str = Depends(require_counsellor),
+    db: AsyncSession = Depends(async_get_db),
 ):
-    # Confirm counsellor role
-    faculty = db.query(Faculty).get(faculty_id)
-    if not faculty or faculty.designation != "Counsellor":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: not a counsellor"
-        )
-
     # Approve at Level-1
-    return decide_l1(db, app_id, faculty_id, approve=True)
+    return await decide_l1(db, app_id, faculty_id, approve=True)
 
 
 @router.post(
@@ -66,18 +137,10 @@ def approve(
     response_model=ODApplicationResponse,
     summary="Counsellor rejects an OD application"
 )
-def reject(
+async def reject(
     app_id: str,
-    faculty_id: str = Depends(get_current_faculty),
-    db: Session = Depends(get_db),
+    faculty_id: str = Depends(require_counsellor),
+    db: AsyncSession = Depends(async_get_db),
 ):
-    # Confirm counsellor role
-    faculty = db.query(Faculty).get(faculty_id)
-    if not faculty or faculty.designation != "Counsellor":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: not a counsellor"
-        )
-
     # Reject at Level-1
-    return decide_l1(db, app_id, faculty_id, approve=False)
+    return await decide_l1(db, app_id, faculty_id, approve=False)
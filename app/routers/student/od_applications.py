@@ -1,36 +1,106 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status as http_status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_db, async_get_db
 from app.schemas.od_application import (
     ODApplicationCreate,
     ODApplicationResponse,
+    ODApplicationPage,
+    AdmissionTicketResponse,
 )
+from app.models.od_application import ApplicationStatusEnum
+from app.utils.etag import is_not_modified, make_etag
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
+from app.repositories import resource_versions as versions
 from app.services import od_applications as service
+from app.services import od_applications_async as async_service
+from app.services.od_admission import admission, AdmissionTicket
 from app.deps.auth import get_current_student
 
 router = APIRouter(prefix="/student/od", tags=["Student OD"])
 
 
-@router.post("/apply", response_model=ODApplicationResponse)
-def apply_for_od(
+def _ticket_response(ticket: AdmissionTicket) -> AdmissionTicketResponse:
+    return AdmissionTicketResponse(
+        ticket_id=ticket.ticket_id,
+        event_id=ticket.event_id,
+        status=ticket.status,
+        detail=ticket.detail,
+        application=(
+            ODApplicationResponse.from_orm(ticket.application)
+            if ticket.application else None
+        ),
+    )
+
+
+@router.post(
+    "/apply",
+    response_model=ODApplicationResponse,
+    responses={202: {"model": AdmissionTicketResponse, "description": "Queued: the event is in surge mode"}},
+)
+async def apply_for_od(
     application: ODApplicationCreate,
     registration_number: str = Depends(get_current_student),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(async_get_db),
 ):
-    od = service.apply_for_od(db, registration_number, application)
+    # Surge-mode events: queue for the event's group-commit writer, hand back a ticket
+    if await admission.is_surge_event(db, application.event_id):
+        ticket = await admission.submit(application.event_id, registration_number)
+        return JSONResponse(
+            status_code=http_status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(_ticket_response(ticket)),
+        )
+
+    od = await async_service.apply_for_od(db, registration_number, application)
     return ODApplicationResponse.from_orm(od)
 
 
+@router.get("/apply/tickets/{ticket_id}", response_model=AdmissionTicketResponse)
+async def get_admission_ticket(
+    ticket_id: str,
+    registration_number: str = Depends(get_current_student),
+    db: AsyncSession = Depends(async_get_db),
+):
+    # Issued by this worker: answered from memory; otherwise from admission_tickets
+    ticket = await admission.get_ticket(db, ticket_id, registration_number)
+    if not ticket:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found or expired"
+        )
+    return _ticket_response(ticket)
+
 
-@router.get("/applications", response_model=List[ODApplicationResponse])
+
+@router.get("/applications", response_model=ODApplicationPage)
 def list_applications(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    event_id: Optional[str] = None,
+    status: Optional[ApplicationStatusEnum] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     registration_number: str = Depends(get_current_student),
     db: Session = Depends(get_db),
 ):
-    ods = service.list_student_applications(db, registration_number)
-    return [ODApplicationResponse.from_orm(o) for o in ods]
+    # Answer 304 when nothing of this student's has changed since the client's copy
+    etag = make_etag(versions.get_version(db, versions.student_key(registration_number)), request)
+    if is_not_modified(request, etag):
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    rows, next_cursor = service.list_student_applications(
+        db, registration_number,
+        cursor=cursor, limit=limit, event_id=event_id,
+        app_status=status, since=since, until=until,
+    )
+    return page_response(service.LIST_FIELDS, rows, next_cursor, headers)
 
 
 @router.get("/applications/{application_id}", response_model=ODApplicationResponse)
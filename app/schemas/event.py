@@ -1,6 +1,6 @@
 from pydantic import BaseModel, constr
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 
 class EventBase(BaseModel):
@@ -9,6 +9,7 @@ class EventBase(BaseModel):
     date: date
     location: Optional[str]
     seat_limit: int
+    surge_mode: bool = False
 
 
 class EventCreate(EventBase):
@@ -21,6 +22,7 @@ class EventUpdate(BaseModel):
     date: Optional[date]
     location: Optional[str]
     seat_limit: Optional[int]
+    surge_mode: Optional[bool]
 
 
 class EventResponse(EventBase):
@@ -30,3 +32,8 @@ class EventResponse(EventBase):
 
     class Config:
         orm_mode = True   # ✅ Pydantic v1 uses orm_mode instead of from_attributes
+
+
+class EventPage(BaseModel):
+    items: List[EventResponse]
+    next_cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 # app/schemas/event_request.py
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
 from enum import Enum
 
@@ -31,3 +31,8 @@ class EventRequestResponse(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class EventRequestPage(BaseModel):
+    items: List[EventRequestResponse]
+    next_cursor: Optional[str] = None
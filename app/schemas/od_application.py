@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, validator
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -26,6 +26,44 @@ class ODApplicationResponse(BaseModel):
     level2_decision: str
     level2_decision_at: Optional[datetime]
     applied_at: datetime
+    department: Optional[str]
 
     class Config:
         orm_mode = True
+
+
+# ✅ One page of a keyset-paginated listing
+class ODApplicationPage(BaseModel):
+    items: List[ODApplicationResponse]
+    next_cursor: Optional[str] = None
+
+
+# ✅ Bulk Level-1 / Level-2 decision
+MAX_BULK_DECISIONS = 500
+
+
+class ODBulkDecisionRequest(BaseModel):
+    application_ids: List[str]
+
+    # A plain validator rather than conlist(), whose keywords differ between pydantic 1 and 2
+    @validator("application_ids")
+    def check_batch_size(cls, value):
+        if not 1 <= len(value) <= MAX_BULK_DECISIONS:
+            raise ValueError(f"between 1 and {MAX_BULK_DECISIONS} application IDs are required")
+        return value
+
+
+class ODBulkDecisionResult(BaseModel):
+    application_id: str
+    success: bool
+    status: Optional[str] = None
+    detail: Optional[str] = None
+
+
+# ✅ Surge-mode admission ticket (returned with 202, polled until decided)
+class AdmissionTicketResponse(BaseModel):
+    ticket_id: str
+    event_id: str
+    status: str
+    detail: Optional[str] = None
+    application: Optional[ODApplicationResponse] = None
@@ -0,0 +1,235 @@
+# app/services/email_outbox.py
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from os import getenv
+from typing import Optional
+from uuid import uuid4
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.email_outbox import EmailOutbox, OutboxStatusEnum
+from app.utils.email import SMTPConnectionPool, build_message, render_otp_email
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Emails delivered in parallel (also the number of pooled SMTP connections)
+EMAIL_OUTBOX_CONCURRENCY = int(getenv("EMAIL_OUTBOX_CONCURRENCY", 4))
+EMAIL_OUTBOX_BATCH_SIZE = int(getenv("EMAIL_OUTBOX_BATCH_SIZE", 50))
+EMAIL_OUTBOX_POLL_SECONDS = float(getenv("EMAIL_OUTBOX_POLL_SECONDS", 2))
+# A claimed row becomes due again after this long if its worker died mid-send
+EMAIL_OUTBOX_LEASE_SECONDS = int(getenv("EMAIL_OUTBOX_LEASE_SECONDS", 120))
+EMAIL_MAX_ATTEMPTS = int(getenv("EMAIL_MAX_ATTEMPTS", 5))
+EMAIL_RETRY_BASE_SECONDS = int(getenv("EMAIL_RETRY_BASE_SECONDS", 5))
+EMAIL_RETRY_MAX_SECONDS = 3600
+# Bodies carry the OTP in plain text; they are blanked once no retry needs them
+REDACTED_BODY = ""
+
+
+def queue_otp_email(db: Session, recipient: str, otp: str):
+    """
+    Add the OTP email to the outbox. It is written by the caller's commit,
+    together with the OTP row, and the worker is woken once that commit lands.
+    """
+    subject, body = render_otp_email(otp)
+    db.add(EmailOutbox(
+        recipient=recipient,
+        subject=subject,
+        body=body,
+        status=OutboxStatusEnum.PENDING,
+        attempts=0,
+        next_attempt_at=datetime.utcnow()
+    ))
+    event.listen(db, "after_commit", _wake_outbox, once=True)
+    email_outbox.record_queued()
+
+
+def _wake_outbox(session):
+    email_outbox.wake()
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1), EMAIL_RETRY_MAX_SECONDS))
+
+
+class EmailOutboxWorker:
+    """
+    Background sender for the email_outbox table. A dispatcher thread claims
+    due rows in batches and delivers them on a bounded thread pool that shares
+    a pool of persistent SMTP connections. Failures are retried with
+    exponential backoff until EMAIL_MAX_ATTEMPTS, then marked FAILED.
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.smtp_pool = SMTPConnectionPool(concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.send_time = 0.0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="email-outbox")
+        self._thread = threading.Thread(target=self._run, name="email-outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=EMAIL_OUTBOX_POLL_SECONDS + 5)
+        self._executor.shutdown(wait=True)
+        self.smtp_pool.close_all()
+        self._thread = None
+        self._executor = None
+
+    def wake(self):
+        self._wake.set()
+
+    def record_queued(self):
+        with self._lock:
+            self.queued += 1
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                processed = self.process_batch()
+            except Exception:
+                logger.exception("Email outbox batch failed")
+                processed = 0
+            if processed < EMAIL_OUTBOX_BATCH_SIZE:
+                self._wake.wait(EMAIL_OUTBOX_POLL_SECONDS)
+                self._wake.clear()
+
+    def _deliver(self, recipient: str, subject: str, body: str) -> Optional[str]:
+        start = time.perf_counter()
+        try:
+            self.smtp_pool.send(build_message(recipient, subject, body))
+        except Exception as e:
+            return str(e) or e.__class__.__name__
+        finally:
+            with self._lock:
+                self.send_time += time.perf_counter() - start
+        return None
+
+    def process_batch(self) -> int:
+        """Claim, send and record one batch of due emails. Returns the batch size."""
+        claim_token = str(uuid4())
+        db = SessionLocal()
+        try:
+            # 1) Claim due rows; the conditional UPDATE keeps other workers off them
+            now = datetime.utcnow()
+            due_ids = [
+                row_id for (row_id,) in
+                db.query(EmailOutbox.id)
+                  .filter(
+                      EmailOutbox.status == OutboxStatusEnum.PENDING,
+                      EmailOutbox.next_attempt_at <= now
+                  )
+                  .order_by(EmailOutbox.next_attempt_at)
+                  .limit(EMAIL_OUTBOX_BATCH_SIZE)
+                  .all()
+            ]
+            if not due_ids:
+                return 0
+            db.query(EmailOutbox).filter(
+                EmailOutbox.id.in_(due_ids),
+                EmailOutbox.status == OutboxStatusEnum.PENDING,
+                EmailOutbox.next_attempt_at <= now
+            ).update({
+                EmailOutbox.claimed_by: claim_token,
+                EmailOutbox.next_attempt_at: now + timedelta(seconds=EMAIL_OUTBOX_LEASE_SECONDS),
+            }, synchronize_session=False)
+            db.commit()
+
+            claimed = (
+                db.query(EmailOutbox.id, EmailOutbox.recipient, EmailOutbox.subject,
+                         EmailOutbox.body, EmailOutbox.attempts)
+                  .filter(EmailOutbox.claimed_by == claim_token)
+                  .all()
+            )
+
+            # 2) Deliver in parallel over the pooled SMTP connections
+            futures = [
+                self._executor.submit(self._deliver, row.recipient, row.subject, row.body)
+                for row in claimed
+            ]
+            results = [(row, future.result()) for row, future in zip(claimed, futures)]
+
+            # 3) Record outcomes
+            now = datetime.utcnow()
+            sent_ids = [row.id for row, error in results if error is None]
+            if sent_ids:
+                db.query(EmailOutbox).filter(EmailOutbox.id.in_(sent_ids)).update({
+                    EmailOutbox.status: OutboxStatusEnum.SENT,
+                    EmailOutbox.body: REDACTED_BODY,
+                    EmailOutbox.sent_at: now,
+                    EmailOutbox.attempts: EmailOutbox.attempts + 1,
+                    EmailOutbox.claimed_by: None,
+                }, synchronize_session=False)
+
+            retried = failed = 0
+            for row, error in results:
+                if error is None:
+                    continue
+                attempts = row.attempts + 1
+                values = {
+                    EmailOutbox.attempts: attempts,
+                    EmailOutbox.last_error: error[:1000],
+                    EmailOutbox.claimed_by: None,
+                }
+                if attempts >= EMAIL_MAX_ATTEMPTS:
+                    values[EmailOutbox.status] = OutboxStatusEnum.FAILED
+                    values[EmailOutbox.body] = REDACTED_BODY
+                    failed += 1
+                    logger.error("Giving up on email %s to %s: %s", row.id, row.recipient, error)
+                else:
+                    values[EmailOutbox.next_attempt_at] = now + _retry_delay(attempts)
+                    retried += 1
+                    logger.warning("Email %s to %s failed (attempt %d): %s", row.id, row.recipient, attempts, error)
+                db.query(EmailOutbox).filter(EmailOutbox.id == row.id).update(values, synchronize_session=False)
+            db.commit()
+
+            with self._lock:
+                self.sent += len(sent_ids)
+                self.retried += retried
+                self.failed += failed
+            return len(claimed)
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            attempts = self.sent + self.retried + self.failed
+            stats = {
+                "concurrency": self.concurrency,
+                "running": self._thread is not None,
+                "queued": self.queued,
+                "sent": self.sent,
+                "retried": self.retried,
+                "failed": self.failed,
+                "avg_send_ms": round(self.send_time / attempts * 1000, 3) if attempts else 0.0,
+            }
+        stats.update(self.smtp_pool.stats())
+        return stats
+
+
+email_outbox = EmailOutboxWorker(EMAIL_OUTBOX_CONCURRENCY)
@@ -3,12 +3,13 @@
 from uuid import uuid4
 from typing import Optional
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.models.event_request import EventRequest, RequestStatusEnum
 from app.schemas.event_request import EventRequestCreate
+from app.utils.pagination import DEFAULT_PAGE_SIZE, filter_range, paginate
 
 
 def create_event_request(
@@ -34,16 +35,18 @@ def create_event_request(
     return new_req
 
 def list_pending_requests(
-    db: Session
-) -> List[EventRequest]:
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Tuple[List[EventRequest], Optional[str]]:
     """
-    Return all EventRequest rows still in PENDING status.
+    Return one page of EventRequest rows still in PENDING status, oldest first.
     """
-    return (
-        db.query(EventRequest)
-          .filter_by(status=RequestStatusEnum.PENDING)
-          .all()
-    )
+    query = db.query(EventRequest).filter_by(status=RequestStatusEnum.PENDING)
+    query = filter_range(query, EventRequest.created_at, since, until)
+    return paginate(query, EventRequest.created_at, EventRequest.request_id, cursor, limit)
 
 def review_event_request(
     db: Session,
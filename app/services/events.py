@@ -1,11 +1,17 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from datetime import date
+from app.models.od_application import ODApplication, DecisionEnum
+from app.repositories import counsellor_loads
 from app.repositories import events as repo
+from app.repositories import resource_versions as versions
 from app.schemas.event import EventCreate, EventUpdate  # ✅ Import EventUpdate
+from app.services.od_admission import admission
 
-def list_faculty_events(db: Session, faculty_id: str):
-    return repo.get_faculty_events(db, faculty_id)
+LIST_FIELDS = repo.LIST_FIELDS
+
+def list_faculty_events(db: Session, faculty_id: str, **filters):
+    return repo.get_faculty_events(db, faculty_id, **filters)
 
 def create_new_event(db: Session, faculty_id: str, event_data: EventCreate):
     if event_data.date < date.today():
@@ -16,7 +22,26 @@ def delete_faculty_event(db: Session, faculty_id: str, event_id: str):
     event = repo.get_event_by_id(db, event_id)
     if not event or event.created_by != faculty_id:
         raise HTTPException(status_code=404, detail="Event not found or not owned by you")
+    # Its applications go with it (ON DELETE CASCADE), so every listing that showed them changes
+    affected = (
+        db.query(ODApplication.registration_number, ODApplication.level1_approver_id,
+                 ODApplication.department, ODApplication.level1_decision)
+          .filter(ODApplication.event_id == event_id)
+          .all()
+    )
+    if affected:
+        pending: dict = {}
+        for row in affected:
+            if row.level1_decision == DecisionEnum.PENDING:
+                pending[row.level1_approver_id] = pending.get(row.level1_approver_id, 0) - 1
+        counsellor_loads.adjust(db, pending)
+        versions.bump_versions(db, [
+            *(versions.l2_queue_key(row.department) for row in affected),
+            *(versions.student_key(row.registration_number) for row in affected),
+            *(versions.l1_queue_key(row.level1_approver_id) for row in affected),
+        ])
     repo.delete_event(db, event)
+    admission.invalidate_surge_flag(event_id)
 
 def edit_faculty_event(db: Session, faculty_id: str, event_id: str, data: EventUpdate):
     event = repo.get_event_by_id(db, event_id)
@@ -24,7 +49,10 @@ def edit_faculty_event(db: Session, faculty_id: str, event_id: str, data: EventU
         raise HTTPException(status_code=404, detail="Event not found or not owned by you")
     if data.date and data.date < date.today():
         raise HTTPException(status_code=400, detail="Event date cannot be in the past")
-    return repo.update_event(db, event, data)
+    event = repo.update_event(db, event, data)
+    admission.invalidate_surge_flag(event_id)
+    return event
+
+def reconcile_events(db: Session) -> dict:
+    return repo.reconcile_event_seats(db)
 
-def check_and_update_event_status(db: Session, event_id: str):
-    repo.update_event_status_if_filled(db, event_id)
@@ -0,0 +1,226 @@
+# app/services/l1_routing.py
+"""
+Level-1 routing and load balancing.
+
+With L1_ROUTING_POLICY=least_loaded, a new application goes to the student's
+mapped counsellor unless their queue is more than L1_REBALANCE_MARGIN deeper
+than the shortest one among accepting counsellors of the student's
+department; then it goes to that least-loaded colleague. Queue depths come
+from counsellor_loads, which every write that adds or removes pending work
+adjusts in its own transaction, so routing never counts a queue. rebalance()
+moves already-queued work off away or overloaded counsellors.
+"""
+
+import threading
+import time
+from os import getenv
+from typing import Dict, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.models.od_application import ODApplication, ApplicationStatusEnum, DecisionEnum
+from app.repositories import counsellor_loads as loads_repo
+from app.repositories import resource_versions as versions
+from app.repositories.counsellor_mappings import StudentRouting
+from app.services.queue_events import notify_l1
+
+load_dotenv()
+
+# "mapped" (always the student's own counsellor) or "least_loaded"
+L1_ROUTING_POLICY = getenv("L1_ROUTING_POLICY", "mapped").lower()
+# Extra pending applications tolerated on the mapped counsellor before spilling over
+L1_REBALANCE_MARGIN = int(getenv("L1_REBALANCE_MARGIN", 10))
+# How long a worker routes from its snapshot of a department's queue depths
+L1_LOAD_SNAPSHOT_SECONDS = float(getenv("L1_LOAD_SNAPSHOT_SECONDS", 2))
+
+
+def balancing_enabled() -> bool:
+    return L1_ROUTING_POLICY == "least_loaded"
+
+
+class LoadBalancer:
+    def __init__(self):
+        # department -> (expires at, accepting counsellors' depths, every counsellor with a load row)
+        self._snapshots: Dict[str, Tuple[float, Dict[str, int], Set[str]]] = {}
+        self._lock = threading.Lock()
+        self.routed_mapped = 0
+        self.routed_backup = 0
+
+    def _snapshot(self, db: Session, department: str) -> Tuple[float, Dict[str, int], Set[str]]:
+        # The lock only guards the dict: the query runs without it, since it
+        # may wait on the event loop that another choose() is blocking
+        now = time.monotonic()
+        with self._lock:
+            snapshot = self._snapshots.get(department)
+        if snapshot is not None and snapshot[0] > now:
+            return snapshot
+        rows = loads_repo.loads(db, department)
+        fresh = (
+            now + L1_LOAD_SNAPSHOT_SECONDS,
+            {row.counsellor_id: row.pending for row in rows if row.accepting},
+            {row.counsellor_id for row in rows},
+        )
+        with self._lock:
+            current = self._snapshots.get(department)
+            # Another thread may have refreshed it meanwhile; keep its local counts
+            if current is None or current[0] <= now:
+                current = self._snapshots[department] = fresh
+            return current
+
+    def choose(self, db: Session, routing: StudentRouting) -> str:
+        """Counsellor who should get the student's next application."""
+        if not balancing_enabled() or not routing.department:
+            return routing.counsellor_id
+        _, depths, known = self._snapshot(db, routing.department)
+        with self._lock:
+            if not depths or routing.counsellor_id not in known:
+                # Nobody accepting, or a counsellor with no load row yet
+                # (recount adds it): stay with the mapping
+                self.routed_mapped += 1
+                return routing.counsellor_id
+            least = min(depths, key=depths.get)
+            mapped = depths.get(routing.counsellor_id)
+            if mapped is not None and mapped <= depths[least] + L1_REBALANCE_MARGIN:
+                chosen = routing.counsellor_id
+                self.routed_mapped += 1
+            else:
+                chosen = least
+                self.routed_backup += 1
+            # Count it locally so the rest of this snapshot's window spreads out
+            depths[chosen] += 1
+            return chosen
+
+    def invalidate(self, department: Optional[str] = None):
+        with self._lock:
+            if department is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(department, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "policy": L1_ROUTING_POLICY,
+                "margin": L1_REBALANCE_MARGIN,
+                "routed_mapped": self.routed_mapped,
+                "routed_backup": self.routed_backup,
+            }
+
+
+balancer = LoadBalancer()
+
+
+def _plan_moves(db: Session, rows) -> List[dict]:
+    """Pick pending applications to move within one department, oldest first."""
+    depths = {row.counsellor_id: row.pending for row in rows if row.accepting}
+    if not depths:
+        return []
+    target = sum(depths.values()) // len(depths) + L1_REBALANCE_MARGIN
+    moves = []
+    for row in sorted(rows, key=lambda r: -r.pending):
+        excess = row.pending if not row.accepting else row.pending - target
+        if excess <= 0:
+            continue
+        queued = (
+            db.query(ODApplication.application_id, ODApplication.event_id,
+                     ODApplication.registration_number)
+              .filter(
+                  ODApplication.level1_approver_id == row.counsellor_id,
+                  ODApplication.level1_decision == DecisionEnum.PENDING
+              )
+              .order_by(ODApplication.applied_at)
+              .limit(excess)
+              .with_for_update()
+              .all()
+        )
+        for app in queued:
+            candidates = {cid: n for cid, n in depths.items() if cid != row.counsellor_id}
+            if not candidates:
+                break
+            to = min(candidates, key=candidates.get)
+            # An accepting counsellor only sheds work while it actually evens things out
+            if row.accepting and depths[to] + 1 >= depths[row.counsellor_id]:
+                break
+            depths[to] += 1
+            if row.counsellor_id in depths:
+                depths[row.counsellor_id] -= 1
+            moves.append({
+                "b_application_id": app.application_id,
+                "b_from": row.counsellor_id,
+                "b_to": to,
+                "event_id": app.event_id,
+                "registration_number": app.registration_number,
+            })
+    return moves
+
+
+def rebalance(db: Session, department: Optional[str] = None) -> dict:
+    """
+    Move pending Level-1 work off away counsellors (all of it) and off
+    counsellors more than L1_REBALANCE_MARGIN above their department's
+    average, onto the least-loaded accepting colleagues.
+    """
+    by_department: Dict[Optional[str], list] = {}
+    for row in loads_repo.loads(db, department):
+        by_department.setdefault(row.department, []).append(row)
+
+    moves = []
+    for dept, rows in by_department.items():
+        if dept:
+            moves.extend(_plan_moves(db, rows))
+
+    moved = 0
+    if moves:
+        table = ODApplication.__table__
+        stmt = (
+            update(table)
+              .where(
+                  table.c.application_id == bindparam("b_application_id"),
+                  table.c.level1_approver_id == bindparam("b_from"),
+                  table.c.level1_decision == DecisionEnum.PENDING,
+              )
+              .values(level1_approver_id=bindparam("b_to"))
+        )
+        db.execute(stmt, [{k: m[k] for k in ("b_application_id", "b_from", "b_to")} for m in moves])
+        deltas: Dict[str, int] = {}
+        for m in moves:
+            deltas[m["b_from"]] = deltas.get(m["b_from"], 0) - 1
+            deltas[m["b_to"]] = deltas.get(m["b_to"], 0) + 1
+        loads_repo.adjust(db, deltas)
+        versions.bump_versions(db, [
+            *(versions.l1_queue_key(cid) for cid in deltas),
+            *(versions.student_key(m["registration_number"]) for m in moves),
+        ])
+        moved = len(moves)
+    db.commit()
+    balancer.invalidate(department)
+
+    for m in moves:
+        notify_l1(m["b_from"], "reassigned", m["b_application_id"], m["event_id"], ApplicationStatusEnum.PENDING)
+        notify_l1(m["b_to"], "created", m["b_application_id"], m["event_id"], ApplicationStatusEnum.PENDING)
+    return {"departments": len(by_department), "moved": moved}
+
+
+def set_availability(db: Session, counsellor_id: str, accepting: bool) -> dict:
+    if not loads_repo.set_accepting(db, counsellor_id, accepting):
+        # First use for this counsellor: seed the load rows, then retry
+        db.rollback()
+        loads_repo.recount(db)
+        if not loads_repo.set_accepting(db, counsellor_id, accepting):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Counsellor not found"
+            )
+    db.commit()
+    department = next(
+        (row.department for row in loads_repo.loads(db) if row.counsellor_id == counsellor_id), None
+    )
+    balancer.invalidate(department)
+
+    reassigned = 0
+    if not accepting and balancing_enabled() and department:
+        reassigned = rebalance(db, department)["moved"]
+    return {"counsellor_id": counsellor_id, "accepting": accepting, "reassigned": reassigned}
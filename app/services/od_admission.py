@@ -0,0 +1,286 @@
+# app/services/od_admission.py
+"""
+Surge-mode admission for popular events.
+
+Apply requests for an event with `surge_mode` enabled are not written by the
+request itself. They join that event's in-process queue and get a ticket back;
+a single writer task per event drains the queue and admits each batch with one
+group commit (see admit_batch), so hundreds of simultaneous applicants no longer
+contend on the same event row and unique index. The queue and its writer live
+in the worker process that took the request. The writer also stores each
+batch's tickets (one INSERT, before the 202 goes out) and their outcomes in
+admission_tickets, so a poll can be answered by any worker.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from os import getenv
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models.admission_ticket import TicketStatusEnum
+from app.models.od_application import ODApplication
+from app.repositories import admission_tickets as tickets_repo
+from app.repositories import events as event_repo
+from app.services import od_applications as service
+from app.utils.ttl_cache import TTLCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Queued applications per event before new ones are turned away with 503
+SURGE_QUEUE_MAX = int(getenv("SURGE_QUEUE_MAX", 5000))
+# Applications admitted per group commit
+SURGE_BATCH_SIZE = int(getenv("SURGE_BATCH_SIZE", 200))
+# Time the writer waits for a batch to fill up before committing
+SURGE_BATCH_LINGER_MS = int(getenv("SURGE_BATCH_LINGER_MS", 10))
+SURGE_TICKET_TTL_SECONDS = int(getenv("SURGE_TICKET_TTL_SECONDS", 900))
+# How long a cached surge_mode flag is trusted, and how many events' flags are kept
+SURGE_FLAG_TTL_SECONDS = float(getenv("SURGE_FLAG_TTL_SECONDS", 5))
+SURGE_FLAG_CACHE_SIZE = int(getenv("SURGE_FLAG_CACHE_SIZE", 10000))
+# A writer with nothing to do for this long exits; the next apply restarts it
+SURGE_WRITER_IDLE_SECONDS = 30
+
+
+class AdmissionTicket:
+    __slots__ = ("ticket_id", "event_id", "registration_number", "status",
+                 "detail", "application", "created_at")
+
+    def __init__(self, event_id: str, registration_number: str, ticket_id: Optional[str] = None):
+        self.ticket_id = ticket_id or str(uuid4())
+        self.event_id = event_id
+        self.registration_number = registration_number
+        self.status = TicketStatusEnum.QUEUED
+        self.detail: Optional[str] = None
+        self.application: Optional[ODApplication] = None
+        self.created_at = time.monotonic()
+
+
+class AdmissionController:
+    def __init__(self):
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._writers: Dict[str, asyncio.Task] = {}
+        self._tickets: "OrderedDict[str, AdmissionTicket]" = OrderedDict()
+        # Keyed by whatever event_id clients send, hence bounded
+        self._surge_flags = TTLCache(SURGE_FLAG_CACHE_SIZE, SURGE_FLAG_TTL_SECONDS)
+        # Batches between admit_batch and their ticket outcomes being stored
+        self._in_flight = 0
+        self.submitted = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.overflowed = 0
+        self.batches = 0
+        self.batch_time = 0.0
+
+    async def is_surge_event(self, db: AsyncSession, event_id: str) -> bool:
+        flag = self._surge_flags.get(event_id)
+        if flag is None:
+            flag = await db.run_sync(event_repo.is_surge_mode, event_id)
+            self._surge_flags.put(event_id, flag)
+        return flag
+
+    def invalidate_surge_flag(self, event_id: str):
+        self._surge_flags.invalidate([event_id])
+
+    def _overflow(self) -> HTTPException:
+        self.overflowed += 1
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many applications for this event right now, please retry",
+            headers={"Retry-After": "2"},
+        )
+
+    async def submit(self, event_id: str, registration_number: str) -> AdmissionTicket:
+        # 1) Hand the ticket to the event's writer (started on first use, or again after it idled out)
+        queue = self._queues.get(event_id)
+        if queue is None:
+            queue = self._queues[event_id] = asyncio.Queue(maxsize=SURGE_QUEUE_MAX)
+            # In an empty context: the writer outlives this request and must not
+            # inherit its per-request state (e.g. the query counter)
+            self._writers[event_id] = contextvars.Context().run(
+                asyncio.get_running_loop().create_task, self._writer(event_id, queue)
+            )
+        ticket = AdmissionTicket(event_id, registration_number)
+        stored = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait((ticket, stored))
+        except asyncio.QueueFull:
+            raise self._overflow()
+
+        # 2) Answer once the writer has stored it with the rest of its batch
+        #    (one INSERT per batch), so a poll on any worker finds it
+        if not await stored:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Could not queue the application, please retry",
+                headers={"Retry-After": "2"},
+            )
+        self.submitted += 1
+        self._remember(ticket)
+        return ticket
+
+    async def get_ticket(
+        self,
+        db: AsyncSession,
+        ticket_id: str,
+        registration_number: str
+    ) -> Optional[AdmissionTicket]:
+        """This worker's copy if it issued the ticket, otherwise the stored one."""
+        ticket = self._tickets.get(ticket_id)
+        if ticket is not None:
+            return ticket if ticket.registration_number == registration_number else None
+        found = await db.run_sync(tickets_repo.get, ticket_id, registration_number)
+        if found is None:
+            return None
+        record, application = found
+        # Expired, or still QUEUED long after the worker holding it went away
+        if (datetime.utcnow() - record.created_at).total_seconds() > SURGE_TICKET_TTL_SECONDS:
+            return None
+        ticket = AdmissionTicket(record.event_id, record.registration_number, record.ticket_id)
+        ticket.status = record.status
+        ticket.detail = record.detail
+        ticket.application = application
+        return ticket
+
+    @staticmethod
+    def _outcomes(
+        tickets: List[AdmissionTicket],
+        results: List[Tuple[Optional[ODApplication], Optional[str]]]
+    ) -> List[dict]:
+        """Rows for record_outcomes from admit_batch's (application, detail) results."""
+        return [
+            {
+                "b_ticket_id": t.ticket_id,
+                "b_status": TicketStatusEnum.ACCEPTED if application is not None else TicketStatusEnum.REJECTED,
+                "b_detail": detail,
+                "b_application_id": application.application_id if application is not None else None,
+            }
+            for t, (application, detail) in zip(tickets, results)
+        ]
+
+    @staticmethod
+    def _acknowledge(batch: List[Tuple[AdmissionTicket, asyncio.Future]], stored: bool):
+        for _, future in batch:
+            # A submitter whose client went away has cancelled its future
+            if not future.done():
+                future.set_result(stored)
+
+    def _remember(self, ticket: AdmissionTicket):
+        self._tickets[ticket.ticket_id] = ticket
+        cutoff = time.monotonic() - SURGE_TICKET_TTL_SECONDS
+        while self._tickets:
+            oldest = next(iter(self._tickets.values()))
+            if oldest.created_at >= cutoff or oldest.status == TicketStatusEnum.QUEUED:
+                break
+            self._tickets.popitem(last=False)
+
+    async def _writer(self, event_id: str, queue: asyncio.Queue):
+        try:
+            while True:
+                try:
+                    first = await asyncio.wait_for(queue.get(), timeout=SURGE_WRITER_IDLE_SECONDS)
+                except asyncio.TimeoutError:
+                    return
+                if SURGE_BATCH_LINGER_MS:
+                    await asyncio.sleep(SURGE_BATCH_LINGER_MS / 1000)
+                batch = [first]
+                while len(batch) < SURGE_BATCH_SIZE:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                await self._commit(event_id, batch)
+        finally:
+            # No await since the queue was last seen empty, so nothing can be stranded
+            self._queues.pop(event_id, None)
+            self._writers.pop(event_id, None)
+
+    async def _commit(self, event_id: str, queued: List[Tuple[AdmissionTicket, asyncio.Future]]):
+        start = time.perf_counter()
+        self._in_flight += 1
+        try:
+            async with AsyncSessionLocal() as db:
+                # 1) Store the batch's tickets before anyone is told about them
+                try:
+                    await db.run_sync(tickets_repo.create_many, [
+                        {"ticket_id": t.ticket_id, "event_id": t.event_id,
+                         "registration_number": t.registration_number}
+                        for t, _ in queued
+                    ])
+                except Exception:
+                    logger.exception("Could not store admission tickets for event %s", event_id)
+                    await db.rollback()
+                    self._acknowledge(queued, False)
+                    return
+                self._acknowledge(queued, True)
+                batch = [t for t, _ in queued]
+
+                # 2) Admit the batch
+                try:
+                    results = await db.run_sync(
+                        service.admit_batch, event_id, [t.registration_number for t in batch]
+                    )
+                except Exception:
+                    logger.exception("Surge admission batch for event %s failed", event_id)
+                    await db.rollback()
+                    results = [(None, "Could not process application, please retry")] * len(batch)
+
+                # 3) Outcomes are stored first, then published: a poll never sees one
+                # (here or on another worker) that is not in admission_tickets yet
+                try:
+                    await db.run_sync(tickets_repo.record_outcomes, self._outcomes(batch, results))
+                except Exception:
+                    # This worker still answers polls for them from memory
+                    logger.exception("Could not store ticket outcomes for event %s", event_id)
+
+                for ticket, (application, detail) in zip(batch, results):
+                    if application is not None:
+                        ticket.status = TicketStatusEnum.ACCEPTED
+                        ticket.application = application
+                        self.accepted += 1
+                    else:
+                        ticket.status = TicketStatusEnum.REJECTED
+                        ticket.detail = detail
+                        self.rejected += 1
+        finally:
+            self._in_flight -= 1
+        self.batches += 1
+        self.batch_time += time.perf_counter() - start
+
+    async def drain(self, timeout: float = 10):
+        """
+        Give the writers a chance to admit what is queued, and to finish the
+        batch they are committing, before shutdown.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and (
+            self._in_flight or any(not q.empty() for q in self._queues.values())
+        ):
+            await asyncio.sleep(0.05)
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": {event_id: q.qsize() for event_id, q in self._queues.items()},
+            "batches_in_flight": self._in_flight,
+            "submitted": self.submitted,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "overflowed": self.overflowed,
+            "batches": self.batches,
+            "avg_batch_size": round((self.accepted + self.rejected) / self.batches, 2) if self.batches else 0.0,
+            "avg_batch_ms": round(self.batch_time / self.batches * 1000, 3) if self.batches else 0.0,
+            "admitted_per_second": round((self.accepted + self.rejected) / self.batch_time, 1) if self.batch_time else 0.0,
+        }
+
+
+admission = AdmissionController()
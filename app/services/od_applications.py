@@ -2,8 +2,10 @@
 
 from uuid import uuid4
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -12,9 +14,30 @@ from app.models.od_application import (
     ApplicationStatusEnum,
     DecisionEnum,
 )
+from app.models.faculty import Faculty
 from app.models.faculty_student_mapping import FacultyStudentMapping
-from app.schemas.od_application import ODApplicationCreate
-from app.models.event import Event
+from app.schemas.od_application import ODApplicationCreate, ODApplicationResponse
+from app.models.event import Event, EventStatusEnum
+from app.models.student import Student
+from app.repositories import counsellor_loads
+from app.repositories import counsellor_mappings
+from app.repositories import events as event_repo
+from app.repositories import resource_versions as versions
+from app.repositories import roster as roster_repo
+from app.services.l1_routing import balancer
+from app.services.queue_events import notify_l1, notify_l2
+from app.utils.pagination import DEFAULT_PAGE_SIZE, filter_range, paginate
+
+
+# List endpoints select just the response fields (as plain rows) instead of
+# hydrating ODApplication entities; routes serialize them with page_response.
+LIST_FIELDS = tuple(ODApplicationResponse.__fields__)
+LIST_COLUMNS = [getattr(ODApplication, name) for name in LIST_FIELDS]
+
+
+def _is_duplicate_application(exc: IntegrityError) -> bool:
+    message = str(exc.orig)
+    return "unique_student_event" in message or "UNIQUE constraint failed" in message
 
 
 def apply_for_od(
@@ -22,66 +45,210 @@ def apply_for_od(
     student_reg_no: str,
     application: ODApplicationCreate
 ) -> ODApplication:
-    # 1) Check event exists & seat availability
-    event = db.query(Event).filter_by(event_id=application.event_id).first()
-    if not event:
+    # 1) Event and seat availability in one round trip, joining the counsellor
+    #    mapping and department only when they are not already cached
+    routing = counsellor_mappings.counsellor_cache.get(student_reg_no)
+    if routing is None:
+        query = (
+            db.query(Event.remaining_seats, Event.status,
+                     FacultyStudentMapping.counsellor_id, counsellor_mappings.ROUTING_DEPARTMENT)
+              .select_from(Event)
+              .outerjoin(
+                  FacultyStudentMapping,
+                  FacultyStudentMapping.registration_number == student_reg_no
+              )
+              .outerjoin(
+                  Student,
+                  Student.registration_number == FacultyStudentMapping.registration_number
+              )
+              .outerjoin(Faculty, Faculty.faculty_id == FacultyStudentMapping.counsellor_id)
+        )
+    else:
+        query = db.query(Event.remaining_seats, Event.status)
+    row = query.filter(Event.event_id == application.event_id).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
-    if event.remaining_seats <= 0:
+    if row.status == EventStatusEnum.CLOSED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No seats available for this event"
+            detail="Event is closed for applications"
         )
-
-    # 2) Prevent duplicate applications
-    existing = (
-        db.query(ODApplication)
-          .filter_by(
-              registration_number=student_reg_no,
-              event_id=application.event_id
-          )
-          .first()
-    )
-    if existing:
+    if row.remaining_seats <= 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Already applied for this event"
-        )
-
-    # 3) Find counsellor mapping
-    mapping = (
-        db.query(FacultyStudentMapping)
-          .filter_by(registration_number=student_reg_no)
-          .first()
-    )
-    if not mapping:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No counsellor assigned to this student"
+            detail="No seats available for this event"
         )
+    if routing is None:
+        if not row.counsellor_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No counsellor assigned to this student"
+            )
+        routing = counsellor_mappings.StudentRouting(row.counsellor_id, row.department)
+        counsellor_mappings.counsellor_cache.put(student_reg_no, routing)
+    counsellor_id = balancer.choose(db, routing)
 
-    # 4) Create the OD application
+    # 2) Create the OD application; unique_student_event rejects duplicates.
+    #    Every column is set here so the response needs no refresh.
     new_app = ODApplication(
         application_id=str(uuid4()),
         registration_number=student_reg_no,
         event_id=application.event_id,
         status=ApplicationStatusEnum.PENDING,
-        level1_approver_id=mapping.counsellor_id,
+        level1_approver_id=counsellor_id,
+        level1_decision=DecisionEnum.PENDING,
+        level1_decision_at=None,
+        level2_approver_id=None,
+        level2_decision=DecisionEnum.PENDING,
+        level2_decision_at=None,
+        applied_at=datetime.utcnow(),
+        department=routing.department,
     )
     db.add(new_app)
+    try:
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        if _is_duplicate_application(e):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Already applied for this event"
+            )
+        raise
+
+    # 3) Detach before committing so expire-on-commit does not force a reload
+    counsellor_loads.adjust(db, {counsellor_id: 1})
+    versions.bump_versions(db, [
+        versions.l1_queue_key(counsellor_id),
+        versions.student_key(student_reg_no),
+    ])
+    db.expunge(new_app)
     db.commit()
-    db.refresh(new_app)
+    notify_l1(new_app.level1_approver_id, "created", new_app.application_id,
+              new_app.event_id, new_app.status)
     return new_app
 
+def _apply_one(db: Session, event_id: str, student_reg_no: str):
+    try:
+        return apply_for_od(db, student_reg_no, ODApplicationCreate(event_id=event_id)), None
+    except HTTPException as e:
+        return None, e.detail
+
+
+def admit_batch(
+    db: Session,
+    event_id: str,
+    student_reg_nos: List[str]
+) -> List[Tuple[Optional[ODApplication], Optional[str]]]:
+    """
+    Group-commit a batch of surge-mode applications for one event: one seat
+    check, one mapping lookup, one duplicate lookup and one multi-row INSERT.
+    Returns (application, None) or (None, reason) per student, in order.
+    """
+    # 1) One seat check for the whole batch
+    event = (
+        db.query(Event.remaining_seats, Event.status)
+          .filter(Event.event_id == event_id)
+          .first()
+    )
+    if event is None:
+        return [(None, "Event not found")] * len(student_reg_nos)
+    if event.status == EventStatusEnum.CLOSED:
+        return [(None, "Event is closed for applications")] * len(student_reg_nos)
+    if event.remaining_seats <= 0:
+        return [(None, "No seats available for this event")] * len(student_reg_nos)
+
+    # 2) Counsellor mappings and existing applications for everyone at once
+    unique_reg_nos = list(dict.fromkeys(student_reg_nos))
+    routings = counsellor_mappings.get_routings(db, unique_reg_nos)
+    existing = {
+        reg_no for (reg_no,) in
+        db.query(ODApplication.registration_number)
+          .filter(
+              ODApplication.event_id == event_id,
+              ODApplication.registration_number.in_(unique_reg_nos)
+          )
+          .all()
+    }
+
+    # 3) Insert every admissible application in one flush
+    now = datetime.utcnow()
+    created: Dict[str, ODApplication] = {}
+    for reg_no in unique_reg_nos:
+        if reg_no in existing or reg_no not in routings:
+            continue
+        created[reg_no] = ODApplication(
+            application_id=str(uuid4()),
+            registration_number=reg_no,
+            event_id=event_id,
+            status=ApplicationStatusEnum.PENDING,
+            level1_approver_id=balancer.choose(db, routings[reg_no]),
+            level1_decision=DecisionEnum.PENDING,
+            level1_decision_at=None,
+            level2_approver_id=None,
+            level2_decision=DecisionEnum.PENDING,
+            level2_decision_at=None,
+            applied_at=now,
+            department=routings[reg_no].department,
+        )
+    db.add_all(created.values())
+    try:
+        db.flush()
+    except IntegrityError:
+        # A concurrent non-queued apply won a race: fall back to one at a time
+        db.rollback()
+        return [_apply_one(db, event_id, reg_no) for reg_no in student_reg_nos]
+    queued: Dict[str, int] = {}
+    for new_app in created.values():
+        queued[new_app.level1_approver_id] = queued.get(new_app.level1_approver_id, 0) + 1
+    counsellor_loads.adjust(db, queued)
+    versions.bump_versions(db, [
+        key
+        for new_app in created.values()
+        for key in (versions.l1_queue_key(new_app.level1_approver_id),
+                    versions.student_key(new_app.registration_number))
+    ])
+    for new_app in created.values():
+        db.expunge(new_app)
+    db.commit()
+    for new_app in created.values():
+        notify_l1(new_app.level1_approver_id, "created", new_app.application_id,
+                  new_app.event_id, new_app.status)
+
+    # 4) Report per student; repeats within the batch count as duplicates
+    results = []
+    reported = set()
+    for reg_no in student_reg_nos:
+        if reg_no in existing or reg_no in reported:
+            results.append((None, "Already applied for this event"))
+        elif reg_no not in created:
+            results.append((None, "No counsellor assigned to this student"))
+        else:
+            results.append((created[reg_no], None))
+            reported.add(reg_no)
+    return results
+
 def list_student_applications(
     db: Session,
-    student_reg_no: str
-) -> List[ODApplication]:
-    return db.query(ODApplication)\
-             .filter_by(registration_number=student_reg_no)\
-             .all()
+    student_reg_no: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    event_id: Optional[str] = None,
+    app_status: Optional[ApplicationStatusEnum] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    query = db.query(*LIST_COLUMNS)\
+              .filter_by(registration_number=student_reg_no)
+    if event_id:
+        query = query.filter_by(event_id=event_id)
+    if app_status:
+        query = query.filter_by(status=app_status)
+    query = filter_range(query, ODApplication.applied_at, since, until)
+    return paginate(query, ODApplication.applied_at, ODApplication.application_id, cursor, limit)
 
 
 def get_application_status(
@@ -119,8 +286,15 @@ def cancel_application(
             detail="Cannot cancel (either not found or already processed)"
         )
 
+    counsellor_id, event_id = app.level1_approver_id, app.event_id
     db.delete(app)
+    counsellor_loads.adjust(db, {counsellor_id: -1})
+    versions.bump_versions(db, [
+        versions.l1_queue_key(counsellor_id),
+        versions.student_key(student_reg_no),
+    ])
     db.commit()
+    notify_l1(counsellor_id, "cancelled", application_id, event_id, None)
     return {"detail": "Application cancelled successfully"}
 
 
@@ -130,14 +304,22 @@ def cancel_application(
 
 def list_pending_l1(
     db: Session,
-    counsellor_id: str
-) -> List[ODApplication]:
-    return db.query(ODApplication)\
-             .filter_by(
-                 level1_approver_id=counsellor_id,
-                 level1_decision=DecisionEnum.PENDING
-             )\
-             .all()
+    counsellor_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    event_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    query = db.query(*LIST_COLUMNS)\
+              .filter_by(
+                  level1_approver_id=counsellor_id,
+                  level1_decision=DecisionEnum.PENDING
+              )
+    if event_id:
+        query = query.filter_by(event_id=event_id)
+    query = filter_range(query, ODApplication.applied_at, since, until)
+    return paginate(query, ODApplication.applied_at, ODApplication.application_id, cursor, limit)
 
 
 def decide_l1(
@@ -146,6 +328,7 @@ def decide_l1(
     counsellor_id: str,
     approve: bool
 ) -> ODApplication:
+    # 1) Load the caller's application and validate state
     od = db.query(ODApplication)\
            .filter_by(
                application_id=application_id,
@@ -163,16 +346,118 @@ def decide_l1(
             detail="Already decided at Level 1"
         )
 
-    od.level1_decision = DecisionEnum.APPROVED if approve else DecisionEnum.REJECTED
-    od.level1_decision_at = datetime.utcnow()
-    od.status = (
+    # 2) Apply the decision, unless it was decided or reassigned in the meantime
+    updated = (
+        db.query(ODApplication)
+          .filter(
+              ODApplication.application_id == application_id,
+              ODApplication.level1_approver_id == counsellor_id,
+              ODApplication.level1_decision == DecisionEnum.PENDING
+          )
+          .update({
+              ODApplication.level1_decision: DecisionEnum.APPROVED if approve else DecisionEnum.REJECTED,
+              ODApplication.level1_decision_at: datetime.utcnow(),
+              ODApplication.status: (
+                  ApplicationStatusEnum.L1_APPROVED
+                  if approve else
+                  ApplicationStatusEnum.L1_REJECTED
+              ),
+          }, synchronize_session=False)
+    )
+    if not updated:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Already decided at Level 1"
+        )
+
+    # 3) Only the caller that actually decided it moves the queue counters
+    counsellor_loads.adjust(db, {counsellor_id: -1})
+    versions.bump_versions(db, [
+        versions.l1_queue_key(counsellor_id),
+        versions.student_key(od.registration_number),
+        versions.l2_queue_key(od.department) if approve else None,
+        versions.decisions_key(od.department),
+    ])
+    db.commit()
+    db.refresh(od)
+    notify_l1(counsellor_id, "decided", od.application_id, od.event_id, od.status)
+    if approve:
+        notify_l2("created", od.application_id, od.event_id, od.status, od.department)
+    return od
+
+
+def decide_l1_bulk(
+    db: Session,
+    application_ids: List[str],
+    counsellor_id: str,
+    approve: bool
+) -> List[dict]:
+    """
+    Apply one Level-1 decision to many applications in a single transaction:
+    one locking SELECT and one set-based UPDATE. Returns a result per ID.
+    """
+    application_ids = list(dict.fromkeys(application_ids))
+
+    # 1) Lock the caller's applications among the requested IDs
+    rows = (
+        db.query(ODApplication.application_id, ODApplication.event_id,
+                 ODApplication.registration_number, ODApplication.department,
+                 ODApplication.level1_decision)
+          .filter(
+              ODApplication.application_id.in_(application_ids),
+              ODApplication.level1_approver_id == counsellor_id
+          )
+          .with_for_update()
+          .all()
+    )
+    decisions: Dict[str, DecisionEnum] = {row.application_id: row.level1_decision for row in rows}
+    found = {row.application_id: row for row in rows}
+    pending_ids = [
+        app_id for app_id in application_ids
+        if decisions.get(app_id) == DecisionEnum.PENDING
+    ]
+
+    # 2) Decide all pending ones at once
+    new_status = (
         ApplicationStatusEnum.L1_APPROVED
         if approve else
         ApplicationStatusEnum.L1_REJECTED
     )
+    if pending_ids:
+        db.query(ODApplication)\
+          .filter(ODApplication.application_id.in_(pending_ids))\
+          .update({
+              ODApplication.level1_decision: DecisionEnum.APPROVED if approve else DecisionEnum.REJECTED,
+              ODApplication.level1_decision_at: datetime.utcnow(),
+              ODApplication.status: new_status,
+          }, synchronize_session=False)
+        counsellor_loads.adjust(db, {counsellor_id: -len(pending_ids)})
+        versions.bump_versions(db, [
+            versions.l1_queue_key(counsellor_id),
+            *(versions.student_key(found[app_id].registration_number) for app_id in pending_ids),
+            *(versions.decisions_key(found[app_id].department) for app_id in pending_ids),
+            *(versions.l2_queue_key(found[app_id].department) for app_id in pending_ids if approve),
+        ])
     db.commit()
-    db.refresh(od)
-    return od
+    for app_id in pending_ids:
+        notify_l1(counsellor_id, "decided", app_id, found[app_id].event_id, new_status)
+        if approve:
+            notify_l2("created", app_id, found[app_id].event_id, new_status, found[app_id].department)
+
+    # 3) Report per item
+    results = []
+    for app_id in application_ids:
+        if app_id not in decisions:
+            results.append({"application_id": app_id, "success": False,
+                            "detail": "No pending application assigned to you"})
+        elif decisions[app_id] != DecisionEnum.PENDING:
+            results.append({"application_id": app_id, "success": False,
+                            "detail": "Already decided at Level 1"})
+        else:
+            results.append({"application_id": app_id, "success": True,
+                            "status": new_status.value})
+    return results
 
 
 # ----------------------------------------
@@ -180,31 +465,43 @@ def decide_l1(
 # ----------------------------------------
 
 def list_pending_l2(
-    db: Session
-) -> List[ODApplication]:
-    return db.query(ODApplication)\
-             .filter_by(
-                 status=ApplicationStatusEnum.L1_APPROVED,
-                 level2_decision=DecisionEnum.PENDING
-             )\
-             .all()
+    db: Session,
+    department: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    event_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    query = db.query(*LIST_COLUMNS)\
+              .filter_by(
+                  status=ApplicationStatusEnum.L1_APPROVED,
+                  level2_decision=DecisionEnum.PENDING
+              )
+    if department:
+        query = query.filter_by(department=department)
+    if event_id:
+        query = query.filter_by(event_id=event_id)
+    query = filter_range(query, ODApplication.applied_at, since, until)
+    return paginate(query, ODApplication.applied_at, ODApplication.application_id, cursor, limit)
 
 
 def decide_l2(
     db: Session,
     application_id: str,
     academic_head_id: str,
-    approve: bool
+    approve: bool,
+    department: Optional[str] = None
 ) -> ODApplication:
-    # 1) Load the OD application and validate state
-    od = (
-        db.query(ODApplication)
-          .filter_by(
-              application_id=application_id,
-              status=ApplicationStatusEnum.L1_APPROVED
-          )
-          .first()
-    )
+    # 1) Load the OD application (from the head's own partition) and validate state
+    query = db.query(ODApplication)\
+              .filter_by(
+                  application_id=application_id,
+                  status=ApplicationStatusEnum.L1_APPROVED
+              )
+    if department:
+        query = query.filter_by(department=department)
+    od = query.first()
     if not od:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -216,35 +513,153 @@ def decide_l2(
             detail="Already decided at Level 2"
         )
 
-    # 2) Fetch event to check/decrement seats
-    event = db.query(Event).filter_by(event_id=od.event_id).first()
-    if not event:
+    # 2) Apply the Level-2 decision, unless someone decided it in the meantime
+    updated = (
+        db.query(ODApplication)
+          .filter(
+              ODApplication.application_id == application_id,
+              ODApplication.status == ApplicationStatusEnum.L1_APPROVED,
+              ODApplication.level2_decision == DecisionEnum.PENDING
+          )
+          .update({
+              ODApplication.level2_approver_id: academic_head_id,
+              ODApplication.level2_decision: DecisionEnum.APPROVED if approve else DecisionEnum.REJECTED,
+              ODApplication.level2_decision_at: datetime.utcnow(),
+              ODApplication.status: (
+                  ApplicationStatusEnum.L2_APPROVED
+                  if approve else
+                  ApplicationStatusEnum.L2_REJECTED
+              ),
+          }, synchronize_session=False)
+    )
+    if not updated:
+        db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Associated event not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Already decided at Level 2"
         )
-    if approve and event.remaining_seats <= 0:
+    versions.bump_versions(db, [
+        versions.l2_queue_key(od.department),
+        versions.decisions_key(od.department),
+        versions.student_key(od.registration_number),
+    ])
+    if approve:
+        roster_repo.add_approved(db, [application_id])
+
+    # 3) Consume a seat on final approval. Done last, as one conditional
+    #    UPDATE, so the hot event row stays locked only until the commit.
+    if approve and not event_repo.reserve_seat(db, od.event_id):
+        db.rollback()
+        if not event_repo.get_event_by_id(db, od.event_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Associated event not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No seats available for this event"
         )
 
-    # 3) Apply the Level-2 decision
-    od.level2_approver_id = academic_head_id
-    od.level2_decision     = DecisionEnum.APPROVED if approve else DecisionEnum.REJECTED
-    od.level2_decision_at  = datetime.utcnow()
-    od.status              = (
+    # 4) Persist all changes
+    db.commit()
+    db.refresh(od)
+    notify_l2("decided", od.application_id, od.event_id, od.status, od.department)
+    return od
+
+
+def decide_l2_bulk(
+    db: Session,
+    application_ids: List[str],
+    academic_head_id: str,
+    approve: bool,
+    department: Optional[str] = None
+) -> List[dict]:
+    """
+    Apply one Level-2 decision to many applications in a single transaction.
+    On approval, seats are taken per event for the whole batch at once; when
+    an event runs out, the remaining applications for it are left pending.
+    """
+    application_ids = list(dict.fromkeys(application_ids))
+
+    # 1) Lock the requested applications that are still awaiting Level 2,
+    #    only within the head's own department partition
+    query = (
+        db.query(ODApplication.application_id, ODApplication.event_id,
+                 ODApplication.registration_number, ODApplication.department,
+                 ODApplication.level2_decision)
+          .filter(
+              ODApplication.application_id.in_(application_ids),
+              ODApplication.status == ApplicationStatusEnum.L1_APPROVED
+          )
+    )
+    if department:
+        query = query.filter(ODApplication.department == department)
+    rows = query.with_for_update().all()
+    found = {row.application_id: row for row in rows}
+    failures: Dict[str, str] = {}
+    decidable: List[str] = []
+    for app_id in application_ids:
+        row = found.get(app_id)
+        if row is None:
+            failures[app_id] = "No L1-approved application found"
+        elif row.level2_decision != DecisionEnum.PENDING:
+            failures[app_id] = "Already decided at Level 2"
+        else:
+            decidable.append(app_id)
+
+    # 2) Seat accounting: per event, take what is left with conditional
+    #    UPDATEs; the unlocked read only supplies the first guess
+    if approve and decidable:
+        wanted: Dict[str, List[str]] = {}
+        for app_id in decidable:
+            wanted.setdefault(found[app_id].event_id, []).append(app_id)
+        remaining = dict(
+            db.query(Event.event_id, Event.remaining_seats)
+              .filter(Event.event_id.in_(sorted(wanted)))
+              .all()
+        )
+        decidable = []
+        for event_id, app_ids in sorted(wanted.items()):
+            guess = max(0, min(remaining.get(event_id) or 0, len(app_ids)))
+            taken = event_repo.reserve_seats_up_to(db, event_id, guess) if guess else 0
+            decidable.extend(app_ids[:taken])
+            for app_id in app_ids[taken:]:
+                failures[app_id] = (
+                    "No seats available for this event"
+                    if event_id in remaining else
+                    "Associated event not found"
+                )
+
+    # 3) Decide the batch with one UPDATE
+    new_status = (
         ApplicationStatusEnum.L2_APPROVED
         if approve else
         ApplicationStatusEnum.L2_REJECTED
     )
-
-    # 4) Decrement the seat counter on final approval
-    if approve:
-        event.remaining_seats -= 1
-        db.add(event)
-
-    # 5) Persist all changes
+    if decidable:
+        db.query(ODApplication)\
+          .filter(ODApplication.application_id.in_(decidable))\
+          .update({
+              ODApplication.level2_approver_id: academic_head_id,
+              ODApplication.level2_decision: DecisionEnum.APPROVED if approve else DecisionEnum.REJECTED,
+              ODApplication.level2_decision_at: datetime.utcnow(),
+              ODApplication.status: new_status,
+          }, synchronize_session=False)
+        versions.bump_versions(db, [
+            *(versions.l2_queue_key(found[app_id].department) for app_id in decidable),
+            *(versions.decisions_key(found[app_id].department) for app_id in decidable),
+            *(versions.student_key(found[app_id].registration_number) for app_id in decidable),
+        ])
+        if approve:
+            roster_repo.add_approved(db, decidable)
     db.commit()
-    db.refresh(od)
-    return od
\ No newline at end of file
+    for app_id in decidable:
+        notify_l2("decided", app_id, found[app_id].event_id, new_status, found[app_id].department)
+
+    # 4) Report per item
+    return [
+        {"application_id": app_id, "success": False, "detail": failures[app_id]}
+        if app_id in failures else
+        {"application_id": app_id, "success": True, "status": new_status.value}
+        for app_id in application_ids
+    ]
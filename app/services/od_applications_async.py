@@ -0,0 +1,104 @@
+# app/services/od_applications_async.py
+"""
+Asyncio entry points for the hot OD workflows.
+
+Each coroutine runs the matching function from app.services.od_applications
+on the AsyncSession's connection via run_sync, so the business rules stay in
+one place while the database I/O no longer holds a threadpool slot.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.od_application import ODApplication
+from app.schemas.od_application import ODApplicationCreate
+from app.repositories import resource_versions as versions
+from app.services import l1_routing
+from app.services import od_applications as service
+
+
+async def get_version(db: AsyncSession, key: str) -> int:
+    return await db.run_sync(versions.get_version, key)
+
+
+async def get_version_total(db: AsyncSession, prefix: str) -> int:
+    return await db.run_sync(versions.get_version_total, prefix)
+
+
+async def apply_for_od(
+    db: AsyncSession,
+    student_reg_no: str,
+    application: ODApplicationCreate
+) -> ODApplication:
+    return await db.run_sync(service.apply_for_od, student_reg_no, application)
+
+
+# ----------------------------------------
+# Level 1 (Counsellor) workflows
+# ----------------------------------------
+
+async def list_pending_l1(
+    db: AsyncSession,
+    counsellor_id: str,
+    **filters
+) -> Tuple[List[Row], Optional[str]]:
+    return await db.run_sync(service.list_pending_l1, counsellor_id, **filters)
+
+
+async def decide_l1(
+    db: AsyncSession,
+    application_id: str,
+    counsellor_id: str,
+    approve: bool
+) -> ODApplication:
+    return await db.run_sync(service.decide_l1, application_id, counsellor_id, approve)
+
+
+async def decide_l1_bulk(
+    db: AsyncSession,
+    application_ids: List[str],
+    counsellor_id: str,
+    approve: bool
+) -> List[dict]:
+    return await db.run_sync(service.decide_l1_bulk, application_ids, counsellor_id, approve)
+
+
+async def set_availability(
+    db: AsyncSession,
+    counsellor_id: str,
+    accepting: bool
+) -> dict:
+    return await db.run_sync(l1_routing.set_availability, counsellor_id, accepting)
+
+
+# ----------------------------------------
+# Level 2 (Academic Head) workflows
+# ----------------------------------------
+
+async def list_pending_l2(
+    db: AsyncSession,
+    **filters
+) -> Tuple[List[Row], Optional[str]]:
+    return await db.run_sync(service.list_pending_l2, **filters)
+
+
+async def decide_l2(
+    db: AsyncSession,
+    application_id: str,
+    academic_head_id: str,
+    approve: bool,
+    department: Optional[str] = None
+) -> ODApplication:
+    return await db.run_sync(service.decide_l2, application_id, academic_head_id, approve, department)
+
+
+async def decide_l2_bulk(
+    db: AsyncSession,
+    application_ids: List[str],
+    academic_head_id: str,
+    approve: bool,
+    department: Optional[str] = None
+) -> List[dict]:
+    return await db.run_sync(service.decide_l2_bulk, application_ids, academic_head_id, approve, department)
@@ -0,0 +1,152 @@
+# app/services/od_exports.py
+"""
+Streaming export of OD applications for admins.
+
+Rows come off a server-side cursor (stream_results + yield_per) and are
+encoded and handed to the response a batch at a time, so memory stays flat
+whether the export covers a day or a full academic year.
+"""
+
+import csv
+import enum
+import io
+from datetime import datetime
+from os import getenv
+from typing import Iterator, Optional
+
+import orjson
+from dotenv import load_dotenv
+from sqlalchemy.orm import aliased
+
+from app.database import SessionLocal
+from app.models.event import Event
+from app.models.faculty import Faculty
+from app.models.od_application import ODApplication, ApplicationStatusEnum
+from app.models.student import Student
+from app.utils.pagination import filter_range
+
+load_dotenv()
+
+# Rows fetched from the cursor and written to the response per chunk
+EXPORT_BATCH_SIZE = int(getenv("EXPORT_BATCH_SIZE", 1000))
+
+
+class ExportFormatEnum(str, enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
+L1Approver = aliased(Faculty)
+L2Approver = aliased(Faculty)
+
+EXPORT_COLUMNS = [
+    ODApplication.application_id,
+    ODApplication.registration_number,
+    Student.name.label("student_name"),
+    Student.department.label("department"),
+    ODApplication.event_id,
+    Event.name.label("event_name"),
+    Event.date.label("event_date"),
+    ODApplication.status,
+    ODApplication.level1_approver_id,
+    L1Approver.name.label("level1_approver_name"),
+    ODApplication.level1_decision,
+    ODApplication.level1_decision_at,
+    ODApplication.level2_approver_id,
+    L2Approver.name.label("level2_approver_name"),
+    ODApplication.level2_decision,
+    ODApplication.level2_decision_at,
+    ODApplication.applied_at,
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def _export_query(
+    db,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    department: Optional[str],
+    app_status: Optional[ApplicationStatusEnum],
+):
+    query = (
+        db.query(*EXPORT_COLUMNS)
+          .join(Student, Student.registration_number == ODApplication.registration_number)
+          .join(Event, Event.event_id == ODApplication.event_id)
+          .outerjoin(L1Approver, L1Approver.faculty_id == ODApplication.level1_approver_id)
+          .outerjoin(L2Approver, L2Approver.faculty_id == ODApplication.level2_approver_id)
+    )
+    if department:
+        query = query.filter(Student.department == department)
+    if app_status:
+        query = query.filter(ODApplication.status == app_status)
+    query = filter_range(query, ODApplication.applied_at, since, until)
+    return (
+        query.order_by(ODApplication.applied_at, ODApplication.application_id)
+             .execution_options(stream_results=True)
+             .yield_per(EXPORT_BATCH_SIZE)
+    )
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return value
+
+
+def _batches(rows, size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def encode_rows(rows, fields, export_format: ExportFormatEnum) -> Iterator[bytes]:
+    """Encode `rows` (tuples in `fields` order) as NDJSON or CSV, one chunk per batch."""
+    if export_format == ExportFormatEnum.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        for batch in _batches(rows, EXPORT_BATCH_SIZE):
+            writer.writerows([_csv_value(value) for value in row] for row in batch)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+    else:
+        for batch in _batches(rows, EXPORT_BATCH_SIZE):
+            yield b"".join(
+                orjson.dumps(dict(zip(fields, row))) + b"\n" for row in batch
+            )
+
+
+def stream_od_applications(
+    export_format: ExportFormatEnum,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    department: Optional[str] = None,
+    app_status: Optional[ApplicationStatusEnum] = None,
+) -> Iterator[bytes]:
+    """
+    Yield the export as encoded chunks. Runs with its own session because
+    the body is produced after the route (and its request session) returned.
+    """
+    db = SessionLocal()
+    try:
+        rows = _export_query(db, since, until, department, app_status)
+        yield from encode_rows(rows, EXPORT_FIELDS, export_format)
+    finally:
+        db.close()
@@ -0,0 +1,205 @@
+# app/services/provisioning.py
+"""
+Bulk account provisioning from CSV: students, faculty and counsellor
+mappings. Initial passwords are hashed on every core at once and rows are
+upserted IMPORT_BATCH_SIZE at a time, one statement and commit per batch.
+Re-importing a file updates profile fields but never overwrites (or
+re-hashes) the password of an existing account. Rows whose email belongs to
+another account are rejected.
+"""
+
+import csv
+import enum
+import os
+import time
+from datetime import datetime
+from os import getenv
+from typing import Dict, List, NamedTuple, TextIO, Tuple
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.faculty import Faculty
+from app.models.faculty_student_mapping import FacultyStudentMapping
+from app.models.student import Student
+from app.repositories import counsellor_loads
+from app.repositories import counsellor_mappings
+from app.repositories import provisioning as repo
+from app.utils.security import hash_passwords
+
+load_dotenv()
+
+IMPORT_BATCH_SIZE = int(getenv("IMPORT_BATCH_SIZE", 1000))
+IMPORT_HASH_WORKERS = int(getenv("IMPORT_HASH_WORKERS", os.cpu_count() or 2))
+# Row errors listed in the report (all of them are counted)
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportKindEnum(str, enum.Enum):
+    STUDENTS = "students"
+    FACULTY = "faculty"
+    MAPPINGS = "mappings"
+
+
+class ImportSpec(NamedTuple):
+    model: type
+    key: str
+    required: Tuple[str, ...]
+    optional: Tuple[str, ...] = ()
+    with_password: bool = False
+
+
+SPECS: Dict[ImportKindEnum, ImportSpec] = {
+    ImportKindEnum.STUDENTS: ImportSpec(
+        Student, "registration_number",
+        required=("registration_number", "name", "email", "password"),
+        optional=("department", "year_of_study"),
+        with_password=True,
+    ),
+    ImportKindEnum.FACULTY: ImportSpec(
+        Faculty, "faculty_id",
+        required=("faculty_id", "name", "email", "password"),
+        optional=("designation", "department"),
+        with_password=True,
+    ),
+    ImportKindEnum.MAPPINGS: ImportSpec(
+        FacultyStudentMapping, "registration_number",
+        required=("registration_number", "counsellor_id"),
+    ),
+}
+
+
+def _parse(spec: ImportSpec, source: TextIO, errors: List[str]) -> Dict[str, dict]:
+    reader = csv.DictReader(source)
+    header = [name.strip().lower() for name in reader.fieldnames or []]
+    missing = [name for name in spec.required if name not in header]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV is missing columns: {', '.join(missing)}"
+        )
+    reader.fieldnames = header
+    # Optional columns left out of the file are left alone on existing rows
+    optional = tuple(name for name in spec.optional if name in header)
+
+    rows: Dict[str, dict] = {}
+    for line, raw in enumerate(reader, start=2):
+        row = {name: (raw.get(name) or "").strip() for name in spec.required + optional}
+        empty = [name for name in spec.required if not row[name]]
+        if empty:
+            errors.append(f"line {line}: missing {', '.join(empty)}")
+            continue
+        if "year_of_study" in row:
+            try:
+                row["year_of_study"] = int(row["year_of_study"]) if row["year_of_study"] else None
+            except ValueError:
+                errors.append(f"line {line}: year_of_study must be a number")
+                continue
+        for name in optional:
+            if row[name] == "":
+                row[name] = None
+        # A key repeated in the file: the last row wins
+        rows[row[spec.key]] = row
+    return rows
+
+
+def _drop_unknown_references(db: Session, rows: Dict[str, dict], errors: List[str]):
+    students = repo.existing_keys(db, Student.registration_number, rows)
+    counsellors = repo.existing_keys(db, Faculty.faculty_id, (r["counsellor_id"] for r in rows.values()))
+    for key, row in list(rows.items()):
+        if key not in students:
+            errors.append(f"{key}: unknown student")
+            del rows[key]
+        elif row["counsellor_id"] not in counsellors:
+            errors.append(f"{key}: unknown counsellor {row['counsellor_id']}")
+            del rows[key]
+
+
+def _drop_email_conflicts(db: Session, spec: ImportSpec, rows: Dict[str, dict], errors: List[str]):
+    """
+    Reject rows whose email belongs to another account, in the database or
+    earlier in the file: the upsert would otherwise update that account.
+    """
+    key_column = getattr(spec.model, spec.key)
+    owners = repo.owners(db, key_column, spec.model.email, (r["email"] for r in rows.values()))
+    for key, row in list(rows.items()):
+        email = row["email"].lower()
+        owner = owners.setdefault(email, key)
+        if owner != key:
+            errors.append(f"{key}: email {row['email']} already belongs to {owner}")
+            del rows[key]
+
+
+def import_csv(db: Session, kind: ImportKindEnum, source: TextIO) -> dict:
+    spec = SPECS[kind]
+    start = time.perf_counter()
+    errors: List[str] = []
+
+    # 1) Parse and validate
+    rows = _parse(spec, source, errors)
+    if kind == ImportKindEnum.MAPPINGS:
+        _drop_unknown_references(db, rows, errors)
+    if spec.with_password:
+        _drop_email_conflicts(db, spec, rows, errors)
+    records = list(rows.values())
+
+    # 2) Hash initial passwords in parallel, only for accounts that will be created
+    hash_seconds = 0.0
+    batches = [records]
+    if spec.with_password and records:
+        existing = repo.existing_keys(db, getattr(spec.model, spec.key), rows)
+        new_records = [r for r in records if r[spec.key] not in existing]
+        old_records = [r for r in records if r[spec.key] in existing]
+        now = datetime.utcnow()
+        for record in old_records:
+            del record["password"]
+            record["updated_at"] = now
+        hash_start = time.perf_counter()
+        hashes = hash_passwords([r.pop("password") for r in new_records], IMPORT_HASH_WORKERS)
+        hash_seconds = time.perf_counter() - hash_start
+        for record, password_hash in zip(new_records, hashes):
+            record.update(password_hash=password_hash, is_password_reset=False,
+                          created_at=now, updated_at=now)
+        batches = [new_records, old_records]
+
+    # 3) Upsert in batches; existing accounts keep their password and reset state
+    protected = {spec.key, "password_hash", "is_password_reset", "created_at"}
+    update_columns = [name for name in (records[0] if records else ()) if name not in protected]
+    table = spec.model.__table__
+    upserted = 0
+    # Accounts known to exist (second group) are updated without touching their password
+    chunks = [
+        (write, offset, group[offset:offset + IMPORT_BATCH_SIZE])
+        for write, group in zip((repo.upsert, repo.update_existing), batches)
+        for offset in range(0, len(group), IMPORT_BATCH_SIZE)
+    ]
+    for write, offset, batch in chunks:
+        try:
+            write(db, table, batch, spec.key, update_columns)
+            if kind == ImportKindEnum.FACULTY:
+                counsellor_loads.register(db, batch)
+            db.commit()
+            upserted += len(batch)
+            if kind in (ImportKindEnum.MAPPINGS, ImportKindEnum.STUDENTS):
+                # Counsellor or department may have changed
+                counsellor_mappings.invalidate(row[spec.key] for row in batch)
+            elif "department" in update_columns:
+                # Students without a department are routed under their counsellor's
+                counsellor_mappings.invalidate()
+        except IntegrityError as e:
+            db.rollback()
+            errors.append(f"rows {offset + 1}-{offset + len(batch)} not imported: {e.orig}")
+
+    elapsed = time.perf_counter() - start
+    return {
+        "kind": kind.value,
+        "rows": len(records),
+        "upserted": upserted,
+        "error_count": len(errors),
+        "errors": errors[:MAX_REPORTED_ERRORS],
+        "hash_seconds": round(hash_seconds, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(upserted / elapsed, 1) if elapsed else 0.0,
+    }
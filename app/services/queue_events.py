@@ -0,0 +1,124 @@
+# app/services/queue_events.py
+"""
+In-process pub/sub for approval-queue changes.
+
+The OD services publish a small delta after each commit (an application
+entering, leaving or changing in a queue) and the SSE endpoints fan it out to
+the counsellors / academic heads watching that queue, so clients no longer
+poll the pending lists. Deltas only reach subscribers in the same worker
+process.
+"""
+
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+from fastapi import Request
+
+# Deltas buffered per subscriber before it is told to resync instead
+SUBSCRIBER_BUFFER = 100
+KEEPALIVE_SECONDS = 15
+
+
+def l1_channel(counsellor_id: str) -> str:
+    return f"l1:{counsellor_id}"
+
+
+# Every department's L2 deltas, for academic heads not tied to one department
+L2_CHANNEL = "l2"
+
+
+def l2_channel(department: Optional[str]) -> str:
+    return f"l2:{department or '-'}"
+
+
+class Subscription:
+    def __init__(self, channel: str, loop: asyncio.AbstractEventLoop):
+        self.channel = channel
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_BUFFER)
+
+    def _deliver(self, event: dict):
+        # Runs on the subscriber's event loop
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too far behind: drop the backlog and ask the client to refetch
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+
+
+class QueueEventBroker:
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(channel, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[subscription.channel]
+
+    def publish(self, channel: str, event: dict):
+        """Thread-safe; callable from sync services running in the threadpool."""
+        with self._lock:
+            subscribers = list(self._subscriptions.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # The subscriber's loop has closed
+                self.unsubscribe(subscription)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {channel: len(subs) for channel, subs in self._subscriptions.items()}
+
+
+broker = QueueEventBroker()
+
+
+def _delta(kind: str, application_id: str, event_id: str, status) -> dict:
+    return {
+        "type": kind,
+        "application_id": application_id,
+        "event_id": event_id,
+        "status": getattr(status, "value", status),
+    }
+
+
+def notify_l1(counsellor_id: str, kind: str, application_id: str, event_id: str, status):
+    broker.publish(l1_channel(counsellor_id), _delta(kind, application_id, event_id, status))
+
+
+def notify_l2(kind: str, application_id: str, event_id: str, status, department: Optional[str]):
+    delta = _delta(kind, application_id, event_id, status)
+    broker.publish(l2_channel(department), delta)
+    broker.publish(L2_CHANNEL, delta)
+
+
+async def sse_stream(request: Request, channel: str):
+    """Server-Sent Events generator for one queue channel."""
+    subscription = broker.subscribe(channel)
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+    finally:
+        broker.unsubscribe(subscription)
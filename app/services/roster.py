@@ -0,0 +1,57 @@
+# app/services/roster.py
+
+from datetime import date, timedelta
+from typing import Iterator, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.repositories import roster as repo
+from app.services.od_exports import ExportFormatEnum, EXPORT_BATCH_SIZE, encode_rows
+
+MAX_ROSTER_DAYS = 7
+MAX_EXPORT_DAYS = 366
+
+
+def _date_range(day: date, days: int, max_days: int):
+    if not 1 <= days <= max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"days must be between 1 and {max_days}"
+        )
+    return day, day + timedelta(days=days)
+
+
+def get_roster(db: Session, day: date, days: int = 1, department: Optional[str] = None) -> dict:
+    start, end = _date_range(day, days, MAX_ROSTER_DAYS)
+    rows = repo.roster_query(db, start, end, department).all()
+    return {
+        "from": start,
+        "to": end - timedelta(days=1),
+        "items": [dict(zip(repo.ROSTER_FIELDS, row)) for row in rows],
+    }
+
+
+def stream_roster(
+    export_format: ExportFormatEnum,
+    day: date,
+    days: int = 1,
+    department: Optional[str] = None,
+) -> Iterator[bytes]:
+    # Validate before the response starts; the generator runs afterwards
+    start, end = _date_range(day, days, MAX_EXPORT_DAYS)
+
+    def generate():
+        db = SessionLocal()
+        try:
+            rows = (
+                repo.roster_query(db, start, end, department)
+                    .execution_options(stream_results=True)
+                    .yield_per(EXPORT_BATCH_SIZE)
+            )
+            yield from encode_rows(rows, repo.ROSTER_FIELDS, export_format)
+        finally:
+            db.close()
+
+    return generate()
@@ -0,0 +1,275 @@
+# app/services/sweeper.py
+"""
+Periodic housekeeping that keeps the hot tables small:
+
+- events whose date has passed are set to CLOSED;
+- applications still undecided SWEEP_APPLICATION_GRACE_DAYS after their
+  event are EXPIRED, which takes them out of the counsellor and academic-head
+  queues (and the counsellor load counts);
+- used and expired user_otps rows older than SWEEP_OTP_RETENTION_HOURS,
+  SENT and FAILED email_outbox rows older than SWEEP_OUTBOX_RETENTION_HOURS
+  and surge admission tickets past SURGE_TICKET_TTL_SECONDS are deleted.
+
+Each pass works in chunks of SWEEP_BATCH_SIZE rows, one short transaction
+per chunk, so it never holds many locks or a long undo log. Chunks are
+claimed with SKIP LOCKED, so several workers (or the CLI job) can sweep at
+the same time without doing the same rows twice.
+"""
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from os import getenv
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import and_, case, or_
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.admission_ticket import AdmissionTicketRecord
+from app.models.email_outbox import EmailOutbox, OutboxStatusEnum
+from app.models.event import Event, EventStatusEnum
+from app.models.od_application import ODApplication, ApplicationStatusEnum, DecisionEnum
+from app.models.user_otp import UserOTP
+from app.repositories import counsellor_loads
+from app.repositories import resource_versions as versions
+from app.services.od_admission import SURGE_TICKET_TTL_SECONDS
+from app.services.queue_events import notify_l1, notify_l2
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Run the sweeper inside each app worker (disable when it runs from cron instead)
+SWEEP_ENABLED = getenv("SWEEP_ENABLED", "true").lower() in ("1", "true", "yes")
+SWEEP_INTERVAL_SECONDS = float(getenv("SWEEP_INTERVAL_SECONDS", 900))
+# Rows updated or deleted per transaction
+SWEEP_BATCH_SIZE = int(getenv("SWEEP_BATCH_SIZE", 500))
+# Days after an event during which its applications can still be decided
+SWEEP_APPLICATION_GRACE_DAYS = int(getenv("SWEEP_APPLICATION_GRACE_DAYS", 7))
+SWEEP_OTP_RETENTION_HOURS = float(getenv("SWEEP_OTP_RETENTION_HOURS", 24))
+SWEEP_OUTBOX_RETENTION_HOURS = float(getenv("SWEEP_OUTBOX_RETENTION_HOURS", 72))
+
+OPEN_STATUSES = (EventStatusEnum.OPEN, EventStatusEnum.FILLED)
+UNDECIDED_STATUSES = (ApplicationStatusEnum.PENDING, ApplicationStatusEnum.L1_APPROVED)
+
+
+def close_past_events(db: Session, today: date) -> int:
+    closed = 0
+    while True:
+        event_ids = [
+            event_id for (event_id,) in
+            db.query(Event.event_id)
+              .filter(Event.status.in_(OPEN_STATUSES), Event.date < today)
+              .limit(SWEEP_BATCH_SIZE)
+              .with_for_update(skip_locked=True)
+              .all()
+        ]
+        if not event_ids:
+            break
+        db.query(Event)\
+          .filter(Event.event_id.in_(event_ids))\
+          .update({Event.status: EventStatusEnum.CLOSED}, synchronize_session=False)
+        db.commit()
+        closed += len(event_ids)
+        if len(event_ids) < SWEEP_BATCH_SIZE:
+            break
+    return closed
+
+
+def expire_stale_applications(db: Session, cutoff: date) -> int:
+    """EXPIRE undecided applications for events dated before `cutoff`."""
+    expired = 0
+    while True:
+        # 1) Claim a chunk of undecided applications for old events
+        rows = (
+            db.query(ODApplication.application_id, ODApplication.event_id,
+                     ODApplication.registration_number, ODApplication.department,
+                     ODApplication.level1_approver_id, ODApplication.status)
+              .join(Event, Event.event_id == ODApplication.event_id)
+              .filter(Event.date < cutoff, ODApplication.status.in_(UNDECIDED_STATUSES))
+              .limit(SWEEP_BATCH_SIZE)
+              .with_for_update(of=ODApplication, skip_locked=True)
+              .all()
+        )
+        if not rows:
+            break
+
+        # 2) Retire them; the pending decision(s) become EXPIRED too
+        db.query(ODApplication)\
+          .filter(ODApplication.application_id.in_([row.application_id for row in rows]))\
+          .update({
+              ODApplication.status: ApplicationStatusEnum.EXPIRED,
+              ODApplication.level1_decision: case(
+                  (ODApplication.level1_decision == DecisionEnum.PENDING, DecisionEnum.EXPIRED),
+                  else_=ODApplication.level1_decision,
+              ),
+              ODApplication.level2_decision: DecisionEnum.EXPIRED,
+          }, synchronize_session=False)
+
+        # 3) Queue depths and version counters for every queue they left
+        at_l1 = [row for row in rows if row.status == ApplicationStatusEnum.PENDING]
+        at_l2 = [row for row in rows if row.status == ApplicationStatusEnum.L1_APPROVED]
+        deltas: Dict[str, int] = {}
+        for row in at_l1:
+            deltas[row.level1_approver_id] = deltas.get(row.level1_approver_id, 0) - 1
+        counsellor_loads.adjust(db, deltas)
+        versions.bump_versions(db, [
+            *(versions.l1_queue_key(row.level1_approver_id) for row in at_l1),
+            *(versions.l2_queue_key(row.department) for row in at_l2),
+            *(versions.student_key(row.registration_number) for row in rows),
+        ])
+        db.commit()
+
+        for row in at_l1:
+            notify_l1(row.level1_approver_id, "expired", row.application_id,
+                      row.event_id, ApplicationStatusEnum.EXPIRED)
+        for row in at_l2:
+            notify_l2("expired", row.application_id, row.event_id,
+                      ApplicationStatusEnum.EXPIRED, row.department)
+        expired += len(rows)
+        if len(rows) < SWEEP_BATCH_SIZE:
+            break
+    return expired
+
+
+def _delete_in_chunks(db: Session, key_column, *criteria) -> int:
+    """Delete the rows matching `criteria`, SWEEP_BATCH_SIZE at a time."""
+    deleted = 0
+    while True:
+        keys = [
+            key for (key,) in
+            db.query(key_column)
+              .filter(*criteria)
+              .order_by(key_column)
+              .limit(SWEEP_BATCH_SIZE)
+              .with_for_update(skip_locked=True)
+              .all()
+        ]
+        if not keys:
+            break
+        db.query(key_column.class_)\
+          .filter(key_column.in_(keys))\
+          .delete(synchronize_session=False)
+        db.commit()
+        deleted += len(keys)
+        if len(keys) < SWEEP_BATCH_SIZE:
+            break
+    return deleted
+
+
+def purge_otps(db: Session, cutoff: datetime) -> int:
+    """Delete OTPs that expired, or were used, before `cutoff`."""
+    return _delete_in_chunks(db, UserOTP.id, or_(
+        UserOTP.otp_expiry < cutoff,
+        and_(UserOTP.is_used.is_(True), UserOTP.created_at < cutoff),
+    ))
+
+
+def purge_outbox(db: Session, cutoff: datetime) -> int:
+    """Delete SENT and FAILED emails finished before `cutoff` (ix_email_outbox_due)."""
+    # A finished row keeps the lease end of its last attempt in next_attempt_at
+    return _delete_in_chunks(
+        db, EmailOutbox.id,
+        EmailOutbox.status.in_((OutboxStatusEnum.SENT, OutboxStatusEnum.FAILED)),
+        EmailOutbox.next_attempt_at < cutoff,
+    )
+
+
+def purge_admission_tickets(db: Session, cutoff: datetime) -> int:
+    """Delete surge admission tickets created before `cutoff`; polls 404 after the TTL anyway."""
+    return _delete_in_chunks(db, AdmissionTicketRecord.ticket_id, AdmissionTicketRecord.created_at < cutoff)
+
+
+def sweep(db: Session) -> dict:
+    """One full pass. Returns what was done and how long it took."""
+    start = time.perf_counter()
+    now = datetime.utcnow()
+    today = now.date()
+    stats = {
+        "events_closed": close_past_events(db, today),
+        "applications_expired": expire_stale_applications(
+            db, today - timedelta(days=SWEEP_APPLICATION_GRACE_DAYS)
+        ),
+        "otps_purged": purge_otps(db, now - timedelta(hours=SWEEP_OTP_RETENTION_HOURS)),
+        "emails_purged": purge_outbox(db, now - timedelta(hours=SWEEP_OUTBOX_RETENTION_HOURS)),
+        "tickets_purged": purge_admission_tickets(db, now - timedelta(seconds=SURGE_TICKET_TTL_SECONDS)),
+    }
+    stats["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+class Sweeper:
+    """Runs sweep() every SWEEP_INTERVAL_SECONDS on a background thread."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.failures = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_stats: Optional[dict] = None
+        self.totals = {
+            "events_closed": 0, "applications_expired": 0, "otps_purged": 0,
+            "emails_purged": 0, "tickets_purged": 0,
+        }
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=30)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval)
+
+    def run_once(self) -> Optional[dict]:
+        db = SessionLocal()
+        try:
+            stats = sweep(db)
+        except Exception:
+            db.rollback()
+            logger.exception("Sweep failed")
+            with self._lock:
+                self.failures += 1
+            return None
+        finally:
+            db.close()
+        logger.info("Sweep: %s", stats)
+        with self._lock:
+            self.runs += 1
+            self.last_run_at = datetime.utcnow()
+            self.last_stats = stats
+            for key in self.totals:
+                self.totals[key] += stats[key]
+        return stats
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": SWEEP_ENABLED,
+                "running": self._thread is not None,
+                "interval_seconds": self.interval,
+                "runs": self.runs,
+                "failures": self.failures,
+                "last_run_at": self.last_run_at,
+                "last_run": self.last_stats,
+                "totals": dict(self.totals),
+            }
+
+
+sweeper = Sweeper(SWEEP_INTERVAL_SECONDS)
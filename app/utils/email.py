@@ -1,5 +1,7 @@
 # app/utils/email.py
+import queue
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from os import getenv
@@ -15,9 +17,13 @@ EMAIL_HOST = getenv("EMAIL_HOST")
 EMAIL_PORT = int(getenv("EMAIL_PORT", 587))
 EMAIL_USER = getenv("EMAIL_USER")
 EMAIL_PASSWORD = getenv("EMAIL_PASSWORD")
+EMAIL_FROM = getenv("EMAIL_FROM", EMAIL_USER)
+# Disable for a local stand-in relay such as `python -m aiosmtpd -n`
+EMAIL_USE_TLS = getenv("EMAIL_USE_TLS", "true").lower() in ("1", "true", "yes")
+EMAIL_TIMEOUT = int(getenv("EMAIL_TIMEOUT", 30))
 
 
-def send_otp_email(recipient: str, otp: str):
+def render_otp_email(otp: str):
     subject = "Your OTP for OD Portal"
     body = f"""
     Dear user,
@@ -28,19 +34,97 @@ def send_otp_email(recipient: str, otp: str):
     Regards,
     OD System
     """
+    return subject, body
 
+
+def build_message(recipient: str, subject: str, body: str) -> MIMEMultipart:
     msg = MIMEMultipart()
-    msg['From'] = EMAIL_USER
+    msg['From'] = EMAIL_FROM
     msg['To'] = recipient
     msg['Subject'] = subject
 
     msg.attach(MIMEText(body, 'plain'))
+    return msg
+
+
+class SMTPConnectionPool:
+    """
+    Keeps up to `size` logged-in SMTP connections for reuse, so the TCP,
+    STARTTLS and AUTH handshake is paid once per connection, not per email.
+    """
+
+    def __init__(self, size: int):
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT, timeout=EMAIL_TIMEOUT)
+        try:
+            if EMAIL_USE_TLS:
+                server.starttls()
+            if EMAIL_USER:
+                server.login(EMAIL_USER, EMAIL_PASSWORD)
+        except Exception:
+            self._close(server)
+            raise
+        with self._lock:
+            self.opened += 1
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def send(self, msg: MIMEMultipart):
+        try:
+            server = self._idle.get_nowait()
+            reused = True
+        except queue.Empty:
+            server = self._connect()
+            reused = False
+
+        try:
+            server.sendmail(EMAIL_FROM, msg['To'], msg.as_string())
+        except smtplib.SMTPServerDisconnected:
+            # An idle connection may have been dropped by the relay: retry once on a fresh one
+            server.close()
+            if not reused:
+                raise
+            server = self._connect()
+            reused = False
+            try:
+                server.sendmail(EMAIL_FROM, msg['To'], msg.as_string())
+            except Exception:
+                self._close(server)
+                raise
+        except Exception:
+            self._close(server)
+            raise
+
+        if reused:
+            with self._lock:
+                self.reused += 1
+        try:
+            self._idle.put_nowait(server)
+        except queue.Full:
+            self._close(server)
+
+    def close_all(self):
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
 
-    try:
-        with smtplib.SMTP(EMAIL_HOST, EMAIL_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_USER, EMAIL_PASSWORD)
-            server.sendmail(EMAIL_USER, recipient, msg.as_string())
-        print(f"✅ OTP sent to {recipient}")
-    except Exception as e:
-        print(f"❌ Failed to send email to {recipient}: {e}")
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "idle_connections": self._idle.qsize(),
+                "connections_opened": self.opened,
+                "connections_reused": self.reused,
+            }
@@ -0,0 +1,19 @@
+# app/utils/etag.py
+
+import hashlib
+
+from fastapi import Request
+
+
+def make_etag(version: int, request: Request) -> str:
+    """Weak ETag from a listing's version counter and the query string (page, filters)."""
+    params = hashlib.blake2b(str(request.query_params).encode(), digest_size=6).hexdigest()
+    return f'W/"{version}-{params}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or etag in candidates
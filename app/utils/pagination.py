@@ -0,0 +1,78 @@
+# app/utils/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(sort_value: datetime, key: str) -> str:
+    raw = json.dumps({"t": sort_value.isoformat(), "k": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), str(data["k"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def paginate(query, sort_column, key_column, cursor: Optional[str], limit: int):
+    """
+    Keyset pagination over (sort_column, key_column), oldest first.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        after_value, after_key = decode_cursor(cursor)
+        query = query.filter(or_(
+            sort_column > after_value,
+            and_(sort_column == after_value, key_column > after_key)
+        ))
+    rows = query.order_by(sort_column, key_column).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, key_column.key))
+    return rows, next_cursor
+
+
+def filter_range(query, column, since: Optional[datetime], until: Optional[datetime]):
+    """Restrict `column` to [since, until) when either bound is given."""
+    if since is not None:
+        query = query.filter(column >= since)
+    if until is not None:
+        query = query.filter(column < until)
+    return query
+
+
+def page_response(
+    fields: Sequence[str],
+    rows,
+    next_cursor: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> ORJSONResponse:
+    """
+    Serialize a page of projected rows straight to JSON bytes, skipping
+    per-row pydantic models. `fields` names the leading columns of each row;
+    trailing columns (e.g. a sort key selected only for the cursor) are dropped.
+    """
+    return ORJSONResponse(
+        {"items": [dict(zip(fields, row)) for row in rows], "next_cursor": next_cursor},
+        headers=headers,
+    )
@@ -0,0 +1,84 @@
+# app/utils/password_pool.py
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from os import getenv
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+
+load_dotenv()
+
+# Worker processes dedicated to bcrypt
+PASSWORD_POOL_WORKERS = int(getenv("PASSWORD_POOL_WORKERS", os.cpu_count() or 2))
+# Hash/verify calls allowed in flight (running + queued) before new ones get a 503.
+# Keep this well below the server threadpool size so cheap endpoints always have threads.
+PASSWORD_POOL_MAX_PENDING = int(getenv("PASSWORD_POOL_MAX_PENDING", PASSWORD_POOL_WORKERS * 2))
+
+
+class PasswordPool:
+    """
+    Size-limited process pool for bcrypt work. Callers beyond `max_pending`
+    are turned away immediately instead of queueing behind the login spike.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_time = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created lazily so each server worker process owns its own pool
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def run(self, fn, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server is busy, please retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+            executor = self._get_executor()
+
+        start = time.perf_counter()
+        try:
+            return executor.submit(fn, *args).result()
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self.total_time += time.perf_counter() - start
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_duration_ms": round(self.total_time / self.completed * 1000, 3) if self.completed else 0.0,
+            }
+
+
+password_pool = PasswordPool(PASSWORD_POOL_WORKERS, PASSWORD_POOL_MAX_PENDING)
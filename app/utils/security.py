@@ -1,8 +1,13 @@
+import bcrypt
 import jwt
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from os import getenv
+from typing import List, Optional
 from dotenv import load_dotenv
 
+from app.utils.password_pool import password_pool
+
 load_dotenv()
 
 SECRET_KEY = getenv("JWT_SECRET_KEY")
@@ -10,19 +15,48 @@ ALGORITHM = getenv("JWT_ALGORITHM", "HS256")
 TOKEN_EXPIRE_HOURS = int(getenv("JWT_EXPIRE_HOURS", 2))
 
 
+# bcrypt primitives; these run inside the password pool's worker processes
+def _bcrypt_verify(plain_password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(plain_password, hashed_password)
+
+
+def _bcrypt_hash(password: bytes) -> str:
+    return bcrypt.hashpw(password, bcrypt.gensalt()).decode()
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return sample.checkpw(plain_password.encode(), hashed_password.encode())
+    return password_pool.run(_bcrypt_verify, plain_password.encode(), hashed_password.encode())
 
 
 def hash_password(password: str) -> str:
-    return sample.hashpw(password.encode(), sample.gensalt()).decode()
+    return password_pool.run(_bcrypt_hash, password.encode())
+
+
+def hash_passwords(passwords: List[str], workers: int) -> List[str]:
+    """
+    Hash a batch of passwords across `workers` processes (bulk provisioning).
+    Uses its own pool so a big import never takes the login pool's slots.
+    """
+    if not passwords:
+        return []
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_bcrypt_hash, (p.encode() for p in passwords), chunksize=chunksize))
 
 
-def create_jwt_token(email: str, role: str, user_id: str) -> str:
+def create_jwt_token(
+    email: str,
+    role: str,
+    user_id: str,
+    designation: Optional[str] = None,
+    department: Optional[str] = None,
+) -> str:
     """
     user_id = faculty_id for faculty,
               registration_number for students,
               admin_id for admins.
+    designation = faculty designation, checked by role dependencies.
+    department = faculty department, scopes the Academic Head's L2 queue.
     """
     payload = {
         "sub": email,
@@ -30,4 +64,8 @@ def create_jwt_token(email: str, role: str, user_id: str) -> str:
         "uid": user_id,  # ✅ Include unique ID
         "exp": datetime.utcnow() + timedelta(hours=TOKEN_EXPIRE_HOURS)
     }
+    if designation:
+        payload["designation"] = designation
+    if department:
+        payload["department"] = department
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
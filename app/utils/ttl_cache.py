@@ -0,0 +1,82 @@
+# app/utils/ttl_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU whose entries expire `ttl` seconds after they were stored.
+    `None` is never cached, so a miss always means "ask the database".
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[object, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _lookup(self, key: Hashable, now: float):
+        # Caller holds the lock
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= now:
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def get(self, key: Hashable):
+        with self._lock:
+            return self._lookup(key, time.monotonic())
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, object]:
+        now = time.monotonic()
+        with self._lock:
+            found = {key: self._lookup(key, now) for key in keys}
+        return {key: value for key, value in found.items() if value is not None}
+
+    def put(self, key: Hashable, value):
+        self.put_many({key: value})
+
+    def put_many(self, items: Dict[Hashable, object]):
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for key, value in items.items():
+                if value is None:
+                    continue
+                self._data[key] = (value, expires)
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, keys: Optional[Iterable[Hashable]] = None):
+        """Drop `keys`, or everything when no keys are given."""
+        with self._lock:
+            self.invalidations += 1
+            if keys is None:
+                self._data.clear()
+                return
+            for key in keys:
+                self._data.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,101 @@
+# benchmarks/account_import.py
+"""
+Correctness check for the CSV account import: a full import, then a
+re-import carrying only the required columns, which must leave the optional
+columns it leaves out (department, year_of_study, designation) and every
+password untouched. Also checks that a row carrying another account's email
+is rejected rather than written over that account.
+
+    python -m benchmarks.account_import [--students 200]
+"""
+
+import argparse
+import io
+
+from benchmarks.seed import create_schema, use_scratch_database
+
+use_scratch_database("account_import")
+
+from app.database import SessionLocal  # noqa: E402
+from app.models.faculty import Faculty  # noqa: E402
+from app.models.student import Student  # noqa: E402
+from app.services.provisioning import ImportKindEnum, import_csv  # noqa: E402
+
+
+def csv_text(header, rows) -> io.StringIO:
+    return io.StringIO("\n".join([",".join(header), *(",".join(map(str, row)) for row in rows)]) + "\n")
+
+
+def snapshot(db, model, key, columns):
+    return {
+        row[0]: tuple(row[1:])
+        for row in db.query(getattr(model, key), *(getattr(model, c) for c in columns)).all()
+    }
+
+
+def run_import(db, kind, source) -> dict:
+    report = import_csv(db, kind, source)
+    print(f"{kind.value:<9} {report['upserted']:>6,} of {report['rows']:>6,} rows   "
+          f"{report['rows_per_second']:>8,.0f} rows/s   hashing {report['hash_seconds']:.2f} s   "
+          f"{report['error_count']} errors")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=200)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    reg_nos = [f"S{i:07d}" for i in range(args.students)]
+    faculty_ids = [f"F{i:05d}" for i in range(20)]
+
+    # 1) Full import
+    run_import(db, ImportKindEnum.FACULTY, csv_text(
+        ("faculty_id", "name", "email", "password", "designation", "department"),
+        [(fid, fid, f"{fid.lower()}@bench.local", "initial", "Counsellor", "CSE") for fid in faculty_ids],
+    ))
+    run_import(db, ImportKindEnum.STUDENTS, csv_text(
+        ("registration_number", "name", "email", "password", "department", "year_of_study"),
+        [(reg, reg, f"{reg.lower()}@bench.local", "initial", "CSE", 2) for reg in reg_nos],
+    ))
+    student_columns = ("department", "year_of_study", "password_hash")
+    faculty_columns = ("designation", "department", "password_hash")
+    students_before = snapshot(db, Student, "registration_number", student_columns)
+    faculty_before = snapshot(db, Faculty, "faculty_id", faculty_columns)
+
+    # 2) Re-import with the required columns only (new names, new passwords)
+    run_import(db, ImportKindEnum.FACULTY, csv_text(
+        ("faculty_id", "name", "email", "password"),
+        [(fid, f"Dr {fid}", f"{fid.lower()}@bench.local", "changed") for fid in faculty_ids],
+    ))
+    run_import(db, ImportKindEnum.STUDENTS, csv_text(
+        ("registration_number", "name", "email", "password"),
+        [(reg, f"Student {reg}", f"{reg.lower()}@bench.local", "changed") for reg in reg_nos],
+    ))
+    db.expire_all()
+    assert snapshot(db, Student, "registration_number", student_columns) == students_before, \
+        "a partial student import changed columns it did not carry"
+    assert snapshot(db, Faculty, "faculty_id", faculty_columns) == faculty_before, \
+        "a partial faculty import changed columns it did not carry"
+    renamed = db.query(Student.name).filter(Student.registration_number == reg_nos[0]).scalar()
+    assert renamed == f"Student {reg_nos[0]}", f"the columns it did carry were not updated ({renamed})"
+
+    # 3) A new account claiming an existing account's email is rejected
+    report = run_import(db, ImportKindEnum.STUDENTS, csv_text(
+        ("registration_number", "name", "email", "password"),
+        [("SX000001", "Intruder", f"{reg_nos[0].lower()}@bench.local", "x")],
+    ))
+    db.expire_all()
+    owner = db.query(Student.registration_number, Student.name).filter(
+        Student.email == f"{reg_nos[0].lower()}@bench.local"
+    ).one()
+    assert report["upserted"] == 0 and report["error_count"] == 1, "the email clash was not reported"
+    assert tuple(owner) == (reg_nos[0], f"Student {reg_nos[0]}"), "the email clash overwrote the owner"
+    db.close()
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
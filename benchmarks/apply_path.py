@@ -0,0 +1,127 @@
+# benchmarks/apply_path.py
+"""
+Round trips and latency of POST /student/od/apply: the original lookup
+(event, duplicate and mapping SELECTs, then a refresh after the commit) vs
+apply_for_od (one joined lookup, duplicates left to the unique constraint),
+with N threads applying at once. Both paths write the same rows in the same
+transaction (the application, its counsellor's load and the ETag versions),
+so only the lookup differs. Rounds alternate the paths so neither always
+runs on the fuller table; the counsellor cache is cleared before each "cold"
+run.
+
+    python -m benchmarks.apply_path [--students 1000] [--threads 8] [--rounds 3]
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from uuid import uuid4
+
+from benchmarks.seed import create_schema, percentile, seed_event, seed_people, use_scratch_database
+
+use_scratch_database("apply_path")
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.database import SessionLocal, engine  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.models.faculty_student_mapping import FacultyStudentMapping  # noqa: E402
+from app.models.od_application import ODApplication, ApplicationStatusEnum, DecisionEnum  # noqa: E402
+from app.repositories import counsellor_loads  # noqa: E402
+from app.repositories import counsellor_mappings  # noqa: E402
+from app.repositories import resource_versions as versions  # noqa: E402
+from app.schemas.od_application import ODApplicationCreate  # noqa: E402
+from app.services import od_applications as service  # noqa: E402
+
+_local = threading.local()
+
+
+def _count(conn, cursor, statement, parameters, context, executemany):
+    _local.queries = getattr(_local, "queries", 0) + 1
+
+
+def legacy_apply(db, reg_no: str, application: ODApplicationCreate):
+    """apply_for_od's lookup as it was before the single-lookup rewrite."""
+    event_row = db.query(Event).filter(Event.event_id == application.event_id).first()
+    if not event_row or event_row.remaining_seats <= 0:
+        raise HTTPException(status_code=400, detail="No seats available for this event")
+    if db.query(ODApplication).filter_by(registration_number=reg_no, event_id=application.event_id).first():
+        raise HTTPException(status_code=400, detail="Already applied for this event")
+    mapping = db.query(FacultyStudentMapping).filter_by(registration_number=reg_no).first()
+    if not mapping:
+        raise HTTPException(status_code=404, detail="No counsellor assigned to this student")
+    new_app = ODApplication(
+        application_id=str(uuid4()), registration_number=reg_no, event_id=application.event_id,
+        status=ApplicationStatusEnum.PENDING, level1_approver_id=mapping.counsellor_id,
+        level1_decision=DecisionEnum.PENDING, level2_decision=DecisionEnum.PENDING,
+        applied_at=datetime.utcnow(),
+    )
+    db.add(new_app)
+    db.flush()
+    counsellor_loads.adjust(db, {mapping.counsellor_id: 1})
+    versions.bump_versions(db, [versions.l1_queue_key(mapping.counsellor_id), versions.student_key(reg_no)])
+    db.commit()
+    db.refresh(new_app)
+    return new_app
+
+
+def run(apply, event_id: str, reg_nos, threads: int):
+    """Latencies and average statements per apply for one pass over `reg_nos`."""
+    def one(reg_no: str):
+        db = SessionLocal()
+        _local.queries = 0
+        start = time.perf_counter()
+        try:
+            apply(db, reg_no, ODApplicationCreate(event_id=event_id))
+        finally:
+            db.close()
+        return time.perf_counter() - start, _local.queries
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(one, reg_nos))
+    return [r[0] for r in results], sum(r[1] for r in results) / len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    reg_nos, counsellor_ids, head_id = seed_people(db, args.students, counsellors=20)
+    counsellor_loads.recount(db)
+    db.commit()
+
+    paths = [("legacy", legacy_apply), ("cache cold", service.apply_for_od), ("cache warm", service.apply_for_od)]
+    latencies = {name: [] for name, _ in paths}
+    queries = {name: 0.0 for name, _ in paths}
+    event.listen(engine, "after_cursor_execute", _count)
+    for round_no in range(args.rounds):
+        # Rotate the order each round
+        shift = round_no % len(paths)
+        for name, apply in paths[shift:] + paths[:shift]:
+            event_id = seed_event(db, head_id, args.students)
+            if name == "cache cold":
+                counsellor_mappings.invalidate()
+            elif name == "cache warm":
+                counsellor_mappings.get_routings(db, reg_nos)
+            taken, per_apply = run(apply, event_id, reg_nos, args.threads)
+            latencies[name].extend(taken)
+            queries[name] = per_apply
+    db.close()
+
+    print(f"{args.students:,} applies x {args.rounds} rounds from {args.threads} threads")
+    for name, _ in paths:
+        print(f"{name:<11} {queries[name]:>4.1f} queries/apply   "
+              f"p50 {percentile(latencies[name], 0.5) * 1000:>7.1f} ms   "
+              f"p99 {percentile(latencies[name], 0.99) * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# benchmarks/async_workflows.py
+"""
+End-to-end check of the async OD workflows on aiosqlite (no MySQL needed):
+N concurrent applies, the counsellors' pending lists, N concurrent Level-1
+approvals, the academic head's pending list and N concurrent Level-2
+approvals, all on one event loop through AsyncSession. Prints requests per
+second for each stage and fails if any stage leaves the data inconsistent.
+
+    python -m benchmarks.async_workflows [--students 1000] [--seats 600]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.seed import create_schema, seed_event, seed_people, use_scratch_database
+
+use_scratch_database("async_workflows")
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import func  # noqa: E402
+
+from app.database import AsyncSessionLocal, SessionLocal  # noqa: E402
+from app.models.counsellor_load import CounsellorLoad  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.schemas.od_application import ODApplicationCreate  # noqa: E402
+from app.services import od_applications_async as async_service  # noqa: E402
+from app.utils.pagination import MAX_PAGE_SIZE  # noqa: E402
+
+
+async def stage(name: str, coros):
+    """Run every coroutine at once; count those that raise HTTPException as refused."""
+    async def guarded(coro):
+        try:
+            return await coro
+        except HTTPException:
+            return None
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(guarded(c) for c in coros))
+    elapsed = time.perf_counter() - start
+    done = [r for r in results if r is not None]
+    print(f"{name:<10} {len(results) / elapsed:>10,.0f} req/s   {elapsed:>7.2f} s   "
+          f"{len(done):,} ok   {len(results) - len(done):,} refused")
+    return done
+
+
+async def with_session(fn, *args, **kwargs):
+    async with AsyncSessionLocal() as db:
+        return await fn(db, *args, **kwargs)
+
+
+async def pending(fn, *args) -> list:
+    """Every page of a pending list."""
+    items, cursor = [], None
+    while True:
+        rows, cursor = await with_session(fn, *args, cursor=cursor, limit=MAX_PAGE_SIZE)
+        items.extend(rows)
+        if not cursor:
+            return items
+
+
+async def run(event_id: str, reg_nos, counsellor_ids, head_id: str, seats: int):
+    applied = await stage("apply", [
+        with_session(async_service.apply_for_od, reg_no, ODApplicationCreate(event_id=event_id))
+        for reg_no in reg_nos
+    ])
+    assert len(applied) == len(reg_nos), "an apply was refused"
+
+    l1_queues = await asyncio.gather(*(pending(async_service.list_pending_l1, cid) for cid in counsellor_ids))
+    assert sum(map(len, l1_queues)) == len(reg_nos), "Level-1 queues do not hold every application"
+
+    await stage("decide_l1", [
+        with_session(async_service.decide_l1, row.application_id, row.level1_approver_id, True)
+        for queue in l1_queues for row in queue
+    ])
+    l2_queue = await pending(async_service.list_pending_l2)
+    assert len(l2_queue) == len(reg_nos), "Level-2 queue does not hold every application"
+
+    approved = await stage("decide_l2", [
+        with_session(async_service.decide_l2, row.application_id, head_id, True)
+        for row in l2_queue
+    ])
+    assert len(approved) == min(seats, len(reg_nos)), f"{len(approved)} approved for {seats} seats"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--seats", type=int, default=600)
+    parser.add_argument("--counsellors", type=int, default=10)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    reg_nos, counsellor_ids, head_id = seed_people(db, args.students, args.counsellors)
+    event_id = seed_event(db, head_id, args.seats)
+    db.close()
+
+    print(f"{args.students:,} students, {args.counsellors} counsellors, {args.seats:,} seats")
+    asyncio.run(run(event_id, reg_nos, counsellor_ids, head_id, args.seats))
+
+    db = SessionLocal()
+    try:
+        remaining = db.query(Event.remaining_seats).filter(Event.event_id == event_id).scalar()
+        queued = db.query(func.sum(CounsellorLoad.pending)).scalar()
+    finally:
+        db.close()
+    assert remaining == max(0, args.seats - args.students), f"remaining_seats is {remaining}"
+    assert queued == 0, f"counsellor_loads still counts {queued} pending"
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
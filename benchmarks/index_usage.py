@@ -0,0 +1,152 @@
+# benchmarks/index_usage.py
+"""
+EXPLAIN every hot approval-queue / OTP query and check that it uses the
+index declared for it (migration 001 and later). The statements are the
+ones the services actually send: each is captured while the service runs,
+then explained with the same parameters.
+
+    python -m benchmarks.index_usage [--rows 20000]
+
+Runs EXPLAIN QUERY PLAN on a scratch SQLite file, or EXPLAIN on MySQL when
+DATABASE_URL points at one.
+"""
+
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from benchmarks.seed import create_schema, seed_event, seed_people, use_scratch_database
+
+use_scratch_database("index_usage")
+
+from sqlalchemy import event, insert, text  # noqa: E402
+
+from app.database import SessionLocal, engine  # noqa: E402
+from app.models.event_request import EventRequest, RequestStatusEnum  # noqa: E402
+from app.models.od_application import ODApplication, ApplicationStatusEnum, DecisionEnum  # noqa: E402
+from app.models.user_otp import UserOTP, UserRoleEnum  # noqa: E402
+from app.services import event_requests as request_service  # noqa: E402
+from app.services import od_applications as service  # noqa: E402
+
+DEPARTMENTS = ("CSE", "ECE", "MECH", "CIVIL")
+
+
+def seed(db, rows: int, reg_nos, counsellor_ids, head_id):
+    """A realistic spread: most applications long decided, a few pending per queue."""
+    event_ids = [seed_event(db, head_id, 1000) for _ in range(20)]
+    now = datetime.utcnow()
+    states = [
+        (ApplicationStatusEnum.L2_APPROVED, DecisionEnum.APPROVED, DecisionEnum.APPROVED, 70),
+        (ApplicationStatusEnum.L1_REJECTED, DecisionEnum.REJECTED, DecisionEnum.PENDING, 15),
+        (ApplicationStatusEnum.L1_APPROVED, DecisionEnum.APPROVED, DecisionEnum.PENDING, 8),
+        (ApplicationStatusEnum.PENDING, DecisionEnum.PENDING, DecisionEnum.PENDING, 7),
+    ]
+    weights = [s[3] for s in states]
+    apps, seen = [], set()
+    while len(apps) < rows:
+        reg_no, event_id = random.choice(reg_nos), random.choice(event_ids)
+        if (reg_no, event_id) in seen:
+            continue
+        seen.add((reg_no, event_id))
+        app_status, l1, l2, _ = random.choices(states, weights)[0]
+        apps.append({
+            "application_id": str(uuid4()), "registration_number": reg_no, "event_id": event_id,
+            "status": app_status, "level1_approver_id": random.choice(counsellor_ids),
+            "level1_decision": l1, "level2_decision": l2,
+            "applied_at": now - timedelta(minutes=len(apps)), "department": random.choice(DEPARTMENTS),
+        })
+    db.execute(insert(ODApplication.__table__), apps)
+    db.execute(insert(EventRequest.__table__), [
+        {"request_id": str(uuid4()), "registration_number": random.choice(reg_nos), "name": "Request",
+         "date": now.date(), "status": random.choice(list(RequestStatusEnum)),
+         "created_at": now - timedelta(minutes=i)}
+        for i in range(rows // 4)
+    ])
+    db.execute(insert(UserOTP.__table__), [
+        {"email": f"{random.choice(reg_nos).lower()}@bench.local", "role": UserRoleEnum.STUDENT,
+         "otp_code": f"{random.randrange(10 ** 6):06d}", "otp_expiry": now + timedelta(minutes=5),
+         "is_used": random.random() < 0.9, "created_at": now}
+        for _ in range(rows // 2)
+    ])
+    db.commit()
+
+
+def capture(fn):
+    """Run `fn` and return the SELECT statements it sent, with their parameters."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def plan(statement: str, parameters) -> str:
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            return " | ".join(row[-1] for row in rows)
+        rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+        return " | ".join(f"{row['table']}: key={row['key']}" for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    reg_nos, counsellor_ids, head_id = seed_people(db, 2000, counsellors=40)
+    seed(db, args.rows, reg_nos, counsellor_ids, head_id)
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+        else:
+            conn.execute(text("ANALYZE TABLE od_applications, event_requests, user_otps"))
+
+    student = reg_nos[0]
+    checks = [
+        ("list_pending_l1", "ix_od_applications_l1_queue_applied",
+         lambda: service.list_pending_l1(db, counsellor_ids[0])),
+        ("list_pending_l2", "ix_od_applications_l2_queue_applied",
+         lambda: service.list_pending_l2(db)),
+        ("list_pending_l2 (department)", "ix_od_applications_l2_dept_queue",
+         lambda: service.list_pending_l2(db, department="CSE")),
+        ("list_student_applications", "ix_od_applications_student_applied",
+         lambda: service.list_student_applications(db, student)),
+        ("list_pending_requests", "ix_event_requests_status_created",
+         lambda: request_service.list_pending_requests(db)),
+        # The verify / change / reset OTP lookup in app/routers/auth
+        ("OTP lookup", "ix_user_otps_lookup",
+         lambda: db.query(UserOTP).filter_by(
+             email=f"{student.lower()}@bench.local", role=UserRoleEnum.STUDENT,
+             otp_code="123456", is_used=False,
+         ).first()),
+    ]
+
+    failed = 0
+    for name, index, fn in checks:
+        statements = capture(fn)
+        plans = [plan(statement, parameters) for statement, parameters in statements]
+        used = any(index in p for p in plans)
+        failed += not used
+        print(f"{'ok  ' if used else 'FAIL'} {name:<30} {index}")
+        if not used:
+            for p in plans:
+                print(f"       {p}")
+    db.close()
+    if failed:
+        sys.exit(f"{failed} queries do not use their index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/list_serialization.py
+"""
+Rows/second of the OD list response: ORM entities + from_orm (old path) vs
+column projection + page_response (fast path), on an in-memory SQLite table.
+
+    python -m benchmarks.list_serialization [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+# app.database builds its engines at import time; give it something to point at
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import event, faculty, student  # noqa: F401  (FK targets)
+from app.models.od_application import ODApplication, ApplicationStatusEnum, DecisionEnum
+from app.schemas.od_application import ODApplicationPage, ODApplicationResponse
+from app.services.od_applications import LIST_COLUMNS, LIST_FIELDS
+from app.utils.pagination import page_response
+
+STUDENT = "BENCH0001"
+
+
+def seed(db, rows: int):
+    start = datetime(2025, 1, 1)
+    db.execute(insert(ODApplication.__table__), [
+        {
+            "application_id": str(uuid4()),
+            "registration_number": STUDENT,
+            "event_id": str(uuid4()),
+            "status": ApplicationStatusEnum.PENDING,
+            "level1_approver_id": "FAC0001",
+            "level1_decision": DecisionEnum.PENDING,
+            "level2_decision": DecisionEnum.PENDING,
+            "applied_at": start + timedelta(seconds=i),
+        }
+        for i in range(rows)
+    ])
+    db.commit()
+
+
+def orm_path(db, rows: int) -> bytes:
+    ods = (
+        db.query(ODApplication)
+          .filter_by(registration_number=STUDENT)
+          .order_by(ODApplication.applied_at, ODApplication.application_id)
+          .limit(rows)
+          .all()
+    )
+    page = ODApplicationPage(items=[ODApplicationResponse.from_orm(o) for o in ods], next_cursor=None)
+    # What FastAPI does with a response_model return value
+    return json.dumps(jsonable_encoder(page)).encode()
+
+
+def projection_path(db, rows: int) -> bytes:
+    result = (
+        db.query(*LIST_COLUMNS)
+          .filter_by(registration_number=STUDENT)
+          .order_by(ODApplication.applied_at, ODApplication.application_id)
+          .limit(rows)
+          .all()
+    )
+    return page_response(LIST_FIELDS, result, None).body
+
+
+def measure(name: str, fn, Session, rows: int, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        db = Session()
+        try:
+            start = time.perf_counter()
+            body = fn(db, rows)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            db.close()
+    print(f"{name:<12} {rows / best:>12,.0f} rows/s   {best * 1000:>8.1f} ms   {len(body):>10,} bytes")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    seed(db, args.rows)
+    db.close()
+
+    print(f"{args.rows:,} rows, best of {args.repeat}")
+    orm = measure("orm", orm_path, Session, args.rows, args.repeat)
+    fast = measure("projection", projection_path, Session, args.rows, args.repeat)
+    print(f"speedup      {orm / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/seat_reservation.py
+"""
+Oversubscription stress test for Level-2 seat reservation: many more
+L1-approved applications than seats, approved from hundreds of threads at
+once (single decide_l2 calls mixed with decide_l2_bulk batches). Passes only
+if exactly `seats` applications end up approved, remaining_seats is 0 and the
+roster matches.
+
+    python -m benchmarks.seat_reservation [--seats 100] [--applications 400] [--threads 200]
+
+Uses a scratch SQLite file unless DATABASE_URL points at MySQL (where the
+row locks, not SQLite's single writer, are what is being exercised).
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.seed import create_schema, seed_event, seed_l1_approved, seed_people, use_scratch_database
+
+use_scratch_database("seat_reservation")
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import func  # noqa: E402
+
+from app.database import SessionLocal  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.models.od_application import ODApplication, ApplicationStatusEnum  # noqa: E402
+from app.models.od_roster import ODRoster  # noqa: E402
+from app.services import od_applications as service  # noqa: E402
+
+BULK_SIZE = 10
+
+
+def approve_one(app_id: str, head_id: str, start: threading.Event) -> int:
+    start.wait()
+    db = SessionLocal()
+    try:
+        service.decide_l2(db, app_id, head_id, approve=True)
+        return 1
+    except HTTPException:
+        return 0
+    finally:
+        db.close()
+
+
+def approve_bulk(app_ids, head_id: str, start: threading.Event) -> int:
+    start.wait()
+    db = SessionLocal()
+    try:
+        results = service.decide_l2_bulk(db, app_ids, head_id, approve=True)
+        return sum(1 for r in results if r["success"])
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seats", type=int, default=100)
+    parser.add_argument("--applications", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=200)
+    parser.add_argument("--bulk-share", type=float, default=0.5,
+                        help="fraction of applications approved through decide_l2_bulk")
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    reg_nos, counsellor_ids, head_id = seed_people(db, args.applications)
+    event_id = seed_event(db, head_id, args.seats)
+    app_ids = seed_l1_approved(db, event_id, reg_nos, counsellor_ids[0])
+    db.close()
+
+    random.shuffle(app_ids)
+    split = int(len(app_ids) * args.bulk_share)
+    bulk_ids, single_ids = app_ids[:split], app_ids[split:]
+    start = threading.Event()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        futures = [pool.submit(approve_one, app_id, head_id, start) for app_id in single_ids]
+        futures += [
+            pool.submit(approve_bulk, bulk_ids[i:i + BULK_SIZE], head_id, start)
+            for i in range(0, len(bulk_ids), BULK_SIZE)
+        ]
+        began = time.perf_counter()
+        start.set()
+        reported = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - began
+
+    db = SessionLocal()
+    try:
+        remaining = db.query(Event.remaining_seats).filter(Event.event_id == event_id).scalar()
+        approved = (
+            db.query(func.count())
+              .select_from(ODApplication)
+              .filter(ODApplication.event_id == event_id,
+                      ODApplication.status == ApplicationStatusEnum.L2_APPROVED)
+              .scalar()
+        )
+        rostered = db.query(func.count()).select_from(ODRoster).filter(ODRoster.event_id == event_id).scalar()
+    finally:
+        db.close()
+
+    print(f"{args.applications:,} approvals for {args.seats:,} seats from {args.threads} threads "
+          f"in {elapsed:.2f} s ({len(single_ids)} single, {len(bulk_ids)} in batches of {BULK_SIZE})")
+    print(f"approved {approved}   reported {reported}   remaining_seats {remaining}   roster {rostered}")
+    expected = min(args.seats, args.applications)
+    assert approved <= args.seats, f"oversubscribed: {approved} approved for {args.seats} seats"
+    assert approved == expected, f"{approved} approved, expected {expected}"
+    assert reported == approved, f"callers were told {reported} succeeded, {approved} did"
+    assert remaining == args.seats - approved, f"remaining_seats {remaining} after {approved} approvals"
+    assert rostered == approved, f"{rostered} roster rows for {approved} approvals"
+    print("OK: no oversubscription")
+
+
+if __name__ == "__main__":
+    main()
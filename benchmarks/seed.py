@@ -0,0 +1,139 @@
+# benchmarks/seed.py
+"""
+Shared schema and fixture helpers for the benchmark / stress scripts.
+
+Each script sets DATABASE_URL (a throwaway SQLite file unless one is given)
+before importing app modules, because app.database builds its engines at
+import time and the services open their own sessions from them.
+"""
+
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+from uuid import uuid4
+
+
+def use_scratch_database(name: str) -> str:
+    """Point DATABASE_URL at a fresh SQLite file unless the caller set one."""
+    if "DATABASE_URL" not in os.environ:
+        path = os.path.join(tempfile.mkdtemp(prefix="od-bench-"), f"{name}.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    return os.environ["DATABASE_URL"]
+
+
+def create_schema():
+    from sqlalchemy import event
+
+    from app.database import Base, engine
+    # Every table the services touch
+    from app.models import (  # noqa: F401
+        admin, admission_ticket, counsellor_load, email_outbox, event as event_model,
+        event_request, faculty, faculty_student_mapping, od_application, od_roster,
+        resource_version, student, user_otp,
+    )
+
+    if engine.dialect.name == "sqlite":
+        # Wait for the writer lock instead of failing with "database is locked"
+        @event.listens_for(engine, "connect")
+        def _busy_timeout(dbapi_connection, connection_record):
+            dbapi_connection.execute("PRAGMA busy_timeout = 30000")
+
+        from app.database import async_engine
+
+        @event.listens_for(async_engine.sync_engine, "connect")
+        def _async_busy_timeout(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA busy_timeout = 30000")
+            cursor.close()
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def seed_people(
+    db,
+    students: int,
+    counsellors: int = 1,
+    department: str = "CSE",
+) -> Tuple[List[str], List[str], str]:
+    """Students mapped round-robin to counsellors, plus one academic head."""
+    from sqlalchemy import insert
+
+    from app.models.counsellor_load import CounsellorLoad
+    from app.models.faculty import Faculty
+    from app.models.faculty_student_mapping import FacultyStudentMapping
+    from app.models.student import Student
+
+    now = datetime.utcnow()
+    counsellor_ids = [f"C{i:05d}" for i in range(counsellors)]
+    head_id = "HEAD00001"
+    reg_nos = [f"S{i:07d}" for i in range(students)]
+    db.execute(insert(Faculty.__table__), [
+        {"faculty_id": fid, "name": fid, "email": f"{fid.lower()}@bench.local", "password_hash": "x",
+         "designation": designation, "department": department, "is_password_reset": True,
+         "created_at": now, "updated_at": now}
+        for fid, designation in [*((c, "Counsellor") for c in counsellor_ids), (head_id, "Academic Head")]
+    ])
+    db.execute(insert(Student.__table__), [
+        {"registration_number": reg, "name": reg, "email": f"{reg.lower()}@bench.local", "password_hash": "x",
+         "department": department, "year_of_study": 2, "is_password_reset": True,
+         "created_at": now, "updated_at": now}
+        for reg in reg_nos
+    ])
+    db.execute(insert(FacultyStudentMapping.__table__), [
+        {"registration_number": reg, "counsellor_id": counsellor_ids[i % counsellors]}
+        for i, reg in enumerate(reg_nos)
+    ])
+    db.execute(insert(CounsellorLoad.__table__), [
+        {"counsellor_id": cid, "department": department, "pending": 0, "accepting": True}
+        for cid in counsellor_ids
+    ])
+    db.commit()
+    return reg_nos, counsellor_ids, head_id
+
+
+def seed_event(db, owner_id: str, seats: int, surge_mode: bool = False) -> str:
+    from sqlalchemy import insert
+
+    from app.models.event import Event, EventStatusEnum
+
+    event_id = str(uuid4())
+    db.execute(insert(Event.__table__), [{
+        "event_id": event_id, "name": f"Bench event {event_id[:8]}", "description": "",
+        "date": date.today() + timedelta(days=7), "location": "Hall", "seat_limit": seats,
+        "remaining_seats": seats, "status": EventStatusEnum.OPEN, "surge_mode": surge_mode,
+        "created_by": owner_id, "created_at": datetime.utcnow(),
+    }])
+    db.commit()
+    return event_id
+
+
+def seed_l1_approved(db, event_id: str, reg_nos: List[str], counsellor_id: str, department: str = "CSE") -> List[str]:
+    """Applications already through Level 1, waiting for the academic head."""
+    from sqlalchemy import insert
+
+    from app.models.od_application import ODApplication, ApplicationStatusEnum, DecisionEnum
+
+    now = datetime.utcnow()
+    rows = [
+        {"application_id": str(uuid4()), "registration_number": reg, "event_id": event_id,
+         "status": ApplicationStatusEnum.L1_APPROVED, "level1_approver_id": counsellor_id,
+         "level1_decision": DecisionEnum.APPROVED, "level1_decision_at": now,
+         "level2_decision": DecisionEnum.PENDING, "applied_at": now - timedelta(seconds=i),
+         "department": department}
+        for i, reg in enumerate(reg_nos)
+    ]
+    db.execute(insert(ODApplication.__table__), rows)
+    db.commit()
+    return [row["application_id"] for row in rows]
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = q * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
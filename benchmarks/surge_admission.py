@@ -0,0 +1,128 @@
+# benchmarks/surge_admission.py
+"""
+Surge load test: N students apply to one event at the same moment, either
+through the surge-mode admission queue (group commits) or one request at a
+time (apply_for_od). Reports applications admitted per second and checks
+that every student ends up with exactly one outcome.
+
+    python -m benchmarks.surge_admission [--students 2000] [--seats 500]
+
+Uses a scratch SQLite file unless DATABASE_URL points at a MySQL stand-in.
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.seed import create_schema, percentile, seed_event, seed_people, use_scratch_database
+
+use_scratch_database("surge_admission")
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import func  # noqa: E402
+
+from app.database import AsyncSessionLocal, SessionLocal  # noqa: E402
+from app.models.admission_ticket import AdmissionTicketRecord, TicketStatusEnum  # noqa: E402
+from app.models.od_application import ODApplication  # noqa: E402
+from app.schemas.od_application import ODApplicationCreate  # noqa: E402
+from app.services import od_applications_async as async_service  # noqa: E402
+from app.services.od_admission import admission  # noqa: E402
+
+
+async def surge_run(event_id: str, reg_nos):
+    """Every student submits at once, then polls until their ticket is decided."""
+    async def one(reg_no: str):
+        async with AsyncSessionLocal() as db:
+            ticket = await admission.submit(event_id, reg_no)
+            while True:
+                found = await admission.get_ticket(db, ticket.ticket_id, reg_no)
+                if found.status != TicketStatusEnum.QUEUED:
+                    return found.status
+                await asyncio.sleep(0.01)
+
+    return await asyncio.gather(*(one(reg_no) for reg_no in reg_nos))
+
+
+async def direct_run(event_id: str, reg_nos, concurrency: int):
+    """Same load through the ordinary one-INSERT-per-request apply path."""
+    gate = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(reg_no: str):
+        async with gate, AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            try:
+                await async_service.apply_for_od(db, reg_no, ODApplicationCreate(event_id=event_id))
+                return TicketStatusEnum.ACCEPTED
+            except HTTPException:
+                return TicketStatusEnum.REJECTED
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    return await asyncio.gather(*(one(reg_no) for reg_no in reg_nos)), latencies
+
+
+def check(event_id: str, students: int, outcomes) -> int:
+    db = SessionLocal()
+    try:
+        stored = (
+            db.query(func.count())
+              .select_from(ODApplication)
+              .filter(ODApplication.event_id == event_id)
+              .scalar()
+        )
+        queued = (
+            db.query(func.count())
+              .select_from(AdmissionTicketRecord)
+              .filter(AdmissionTicketRecord.event_id == event_id,
+                      AdmissionTicketRecord.status == TicketStatusEnum.QUEUED)
+              .scalar()
+        )
+    finally:
+        db.close()
+    accepted = sum(1 for status in outcomes if status == TicketStatusEnum.ACCEPTED)
+    assert len(outcomes) == students, "a student got no outcome"
+    assert stored == accepted, f"{accepted} accepted but {stored} applications stored"
+    assert queued == 0, f"{queued} tickets left QUEUED"
+    return accepted
+
+
+async def run(args, surge_event: str, direct_event: str, reg_nos):
+    # One event loop for both runs: the async engine's pool is bound to it
+    start = time.perf_counter()
+    outcomes = await surge_run(surge_event, reg_nos)
+    elapsed = time.perf_counter() - start
+    accepted = check(surge_event, args.students, outcomes)
+    stats = admission.stats()
+    print(f"surge   {args.students / elapsed:>10,.0f} apps/s   {elapsed:>7.2f} s   "
+          f"{accepted:,} accepted   {stats['batches']} batches (avg {stats['avg_batch_size']})")
+
+    start = time.perf_counter()
+    outcomes, latencies = await direct_run(direct_event, reg_nos, args.concurrency)
+    elapsed = time.perf_counter() - start
+    accepted = check(direct_event, args.students, outcomes)
+    print(f"direct  {args.students / elapsed:>10,.0f} apps/s   {elapsed:>7.2f} s   "
+          f"{accepted:,} accepted   p99 {percentile(latencies, 0.99) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--seats", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=100,
+                        help="in-flight requests for the one-at-a-time comparison")
+    args = parser.parse_args()
+
+    create_schema()
+    db = SessionLocal()
+    reg_nos, counsellor_ids, head_id = seed_people(db, args.students, counsellors=20)
+    surge_event = seed_event(db, head_id, args.seats, surge_mode=True)
+    direct_event = seed_event(db, head_id, args.seats)
+    db.close()
+
+    print(f"{args.students:,} simultaneous applicants, {args.seats:,} seats")
+    asyncio.run(run(args, surge_event, direct_event, reg_nos))
+
+
+if __name__ == "__main__":
+    main()
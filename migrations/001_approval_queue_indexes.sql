@@ -0,0 +1,19 @@
+-- migrations/001_approval_queue_indexes.sql
+-- Composite indexes for the approval-queue and OTP lookups.
+-- New databases get these from the models; run this once on existing ones.
+
+-- list_pending_l1 / decide_l1: (level1_approver_id, level1_decision)
+CREATE INDEX ix_od_applications_l1_queue
+    ON od_applications (level1_approver_id, level1_decision);
+
+-- list_pending_l2 / decide_l2: (status, level2_decision)
+CREATE INDEX ix_od_applications_l2_queue
+    ON od_applications (status, level2_decision);
+
+-- list_pending_requests: status
+CREATE INDEX ix_event_requests_status
+    ON event_requests (status);
+
+-- OTP routes: (email, role, is_used[, otp_code])
+CREATE INDEX ix_user_otps_lookup
+    ON user_otps (email, role, is_used, otp_code);
@@ -0,0 +1,22 @@
+-- migrations/002_email_outbox.sql
+-- Durable outbox for OTP emails, drained by the background email worker.
+
+CREATE TABLE email_outbox (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    recipient VARCHAR(255) NOT NULL,
+    subject VARCHAR(255) NOT NULL,
+    body TEXT NOT NULL,
+    status ENUM('PENDING', 'SENT', 'FAILED') NOT NULL DEFAULT 'PENDING',
+    attempts INT NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    claimed_by VARCHAR(36) NULL,
+    last_error TEXT NULL,
+    created_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP NULL
+);
+
+CREATE INDEX ix_email_outbox_due
+    ON email_outbox (status, next_attempt_at);
+
+CREATE INDEX ix_email_outbox_claimed_by
+    ON email_outbox (claimed_by);
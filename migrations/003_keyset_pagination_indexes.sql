@@ -0,0 +1,21 @@
+-- migrations/003_keyset_pagination_indexes.sql
+-- Extend the queue indexes with the keyset pagination column so filtered,
+-- ordered pages are read straight from the index.
+
+CREATE INDEX ix_od_applications_l1_queue_applied
+    ON od_applications (level1_approver_id, level1_decision, applied_at);
+DROP INDEX ix_od_applications_l1_queue ON od_applications;
+
+CREATE INDEX ix_od_applications_l2_queue_applied
+    ON od_applications (status, level2_decision, applied_at);
+DROP INDEX ix_od_applications_l2_queue ON od_applications;
+
+CREATE INDEX ix_od_applications_student_applied
+    ON od_applications (registration_number, applied_at);
+
+CREATE INDEX ix_event_requests_status_created
+    ON event_requests (status, created_at);
+DROP INDEX ix_event_requests_status ON event_requests;
+
+CREATE INDEX ix_events_created_by_created
+    ON events (created_by, created_at);
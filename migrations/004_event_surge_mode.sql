@@ -0,0 +1,5 @@
+-- migrations/004_event_surge_mode.sql
+-- Opt-in per-event admission queue for registration surges.
+
+ALTER TABLE events
+    ADD COLUMN surge_mode BOOLEAN NOT NULL DEFAULT FALSE;
@@ -0,0 +1,7 @@
+-- migrations/005_resource_versions.sql
+-- Change counters behind the ETags of the queue and listing endpoints.
+
+CREATE TABLE resource_versions (
+    `key` VARCHAR(100) NOT NULL PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
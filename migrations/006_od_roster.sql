@@ -0,0 +1,22 @@
+-- migrations/006_od_roster.sql
+-- Date-keyed roster of L2-approved OD, backfilled from existing approvals.
+
+CREATE TABLE od_roster (
+    application_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    registration_number VARCHAR(20) NOT NULL,
+    event_id VARCHAR(36) NOT NULL,
+    event_date DATE NOT NULL,
+    CONSTRAINT fk_od_roster_application FOREIGN KEY (application_id)
+        REFERENCES od_applications (application_id) ON DELETE CASCADE,
+    CONSTRAINT fk_od_roster_event FOREIGN KEY (event_id)
+        REFERENCES events (event_id) ON DELETE CASCADE
+);
+
+CREATE INDEX ix_od_roster_date_student
+    ON od_roster (event_date, registration_number);
+
+INSERT INTO od_roster (application_id, registration_number, event_id, event_date)
+SELECT a.application_id, a.registration_number, a.event_id, e.date
+  FROM od_applications a
+  JOIN events e ON e.event_id = a.event_id
+ WHERE a.status = 'L2_APPROVED';
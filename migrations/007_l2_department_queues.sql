@@ -0,0 +1,12 @@
+-- migrations/007_l2_department_queues.sql
+-- Partition the Academic Head queue by the student's department.
+
+ALTER TABLE od_applications
+    ADD COLUMN department VARCHAR(100) NULL;
+
+UPDATE od_applications a
+  JOIN students s ON s.registration_number = a.registration_number
+   SET a.department = s.department;
+
+CREATE INDEX ix_od_applications_l2_dept_queue
+    ON od_applications (department, status, level2_decision, applied_at);
@@ -0,0 +1,23 @@
+-- migrations/008_counsellor_loads.sql
+-- Incrementally maintained Level-1 queue depth per counsellor, seeded from
+-- the current pending applications.
+
+CREATE TABLE counsellor_loads (
+    counsellor_id VARCHAR(20) NOT NULL PRIMARY KEY,
+    department VARCHAR(100) NULL,
+    pending INT NOT NULL DEFAULT 0,
+    accepting BOOLEAN NOT NULL DEFAULT TRUE,
+    CONSTRAINT fk_counsellor_loads_faculty FOREIGN KEY (counsellor_id)
+        REFERENCES faculty (faculty_id) ON DELETE CASCADE
+);
+
+CREATE INDEX ix_counsellor_loads_department
+    ON counsellor_loads (department, pending);
+
+INSERT INTO counsellor_loads (counsellor_id, department, pending, accepting)
+SELECT f.faculty_id, f.department,
+       (SELECT COUNT(*) FROM od_applications a
+         WHERE a.level1_approver_id = f.faculty_id AND a.level1_decision = 'PENDING'),
+       TRUE
+  FROM faculty f
+ WHERE f.designation = 'Counsellor';
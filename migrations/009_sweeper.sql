@@ -0,0 +1,15 @@
+-- migrations/009_sweeper.sql
+-- EXPIRED state for applications the sweeper retires, and the index its
+-- past-event scan uses.
+
+ALTER TABLE od_applications
+    MODIFY COLUMN status
+        ENUM('PENDING', 'L1_APPROVED', 'L1_REJECTED', 'L2_APPROVED', 'L2_REJECTED', 'EXPIRED')
+        NULL DEFAULT 'PENDING',
+    MODIFY COLUMN level1_decision
+        ENUM('PENDING', 'APPROVED', 'REJECTED', 'EXPIRED') NULL DEFAULT 'PENDING',
+    MODIFY COLUMN level2_decision
+        ENUM('PENDING', 'APPROVED', 'REJECTED', 'EXPIRED') NULL DEFAULT 'PENDING';
+
+CREATE INDEX ix_events_status_date
+    ON events (status, date);
@@ -0,0 +1,17 @@
+-- migrations/010_admission_tickets.sql
+-- Surge-mode admission tickets, readable from every worker process.
+
+CREATE TABLE admission_tickets (
+    ticket_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    event_id VARCHAR(36) NOT NULL,
+    registration_number VARCHAR(20) NOT NULL,
+    status ENUM('QUEUED', 'ACCEPTED', 'REJECTED') NOT NULL DEFAULT 'QUEUED',
+    detail VARCHAR(255) NULL,
+    application_id VARCHAR(36) NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_admission_tickets_event FOREIGN KEY (event_id)
+        REFERENCES events (event_id) ON DELETE CASCADE
+);
+
+CREATE INDEX ix_admission_tickets_created
+    ON admission_tickets (created_at);
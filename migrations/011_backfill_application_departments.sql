@@ -0,0 +1,10 @@
+-- migrations/011_backfill_application_departments.sql
+-- Applications whose student has no department take their counsellor's, so
+-- they reach a department-scoped Academic Head instead of only the
+-- institution-wide queue. New applications are routed the same way.
+
+UPDATE od_applications a
+  JOIN faculty f ON f.faculty_id = a.level1_approver_id
+   SET a.department = f.department
+ WHERE a.department IS NULL
+   AND f.department IS NOT NULL;